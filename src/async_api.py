@@ -0,0 +1,376 @@
+"""
+Asyncio Data-Access API for the Task Manager
+
+This module offers coroutine versions of the task operations
+without any prompts, for services that embed the task manager.
+Each call runs the blocking data-access functions of src.main
+on a bounded thread pool, so at most ASYNC_WORKERS connections
+are open at a time and read-only calls use the read replicas.
+
+Many small operations can be fanned out with run_batch().
+Running the module compares their throughput with the sync path
+and removes the tasks it added afterwards:
+
+    python -m src.async_api --operations 500
+"""
+
+import argparse
+import asyncio
+import contextvars
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import partial
+
+from src.main import (
+    PRIORITIES, DEFAULT_PRIORITY, PAGE_SIZE, commit, create_table,
+    get_db_cursor, get_task as fetch_task, find_tasks, get_next_tasks,
+    parse_status, insert_task, set_task_status, set_task_schedule,
+    remove_task, remove_tasks_described, lock_task
+)
+
+ASYNC_WORKERS = int(os.getenv('DB_ASYNC_WORKERS', '20'))
+KEEP = object()
+
+_executor_lock = threading.Lock()
+_executor = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Returns the shared thread pool, creating it on first use.
+    Event loops in several threads get the same pool.
+
+    Returns:
+        ThreadPoolExecutor: Pool with ASYNC_WORKERS threads.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=ASYNC_WORKERS, thread_name_prefix='task-db'
+            )
+        return _executor
+
+
+def shutdown() -> None:
+    """
+    Waits for running calls and shuts the shared thread pool down.
+
+    Returns:
+        None
+    """
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown()
+
+
+def run_in_session(func, *args, read_only: bool = False):
+    """
+    Calls func(cursor, *args) in its own database session,
+    committing unless the session is read-only.
+
+    Args:
+        func: Data-access function taking a cursor first.
+        *args: Further arguments for func.
+        read_only (bool): Whether the session only reads data.
+
+    Returns:
+        Result of func.
+
+    Raises:
+        ConnectionError: If the database is unreachable.
+    """
+    with get_db_cursor(read_only=read_only) as cursor_data:
+        if cursor_data is None:
+            raise ConnectionError('Failed to connect to the database.')
+        conn, cursor = cursor_data
+        result = func(cursor, *args)
+        if not read_only:
+            commit(conn)
+        return result
+
+
+async def run_db(func, *args, read_only: bool = False):
+    """
+    Runs a data-access function on the shared thread pool,
+    inside the caller's db_session() if there is one.
+
+    Args:
+        func: Data-access function taking a cursor first.
+        *args: Further arguments for func.
+        read_only (bool): Whether the session only reads data.
+
+    Returns:
+        Result of func.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        get_executor(),
+        partial(
+            context.run, run_in_session, func, *args, read_only=read_only
+        )
+    )
+
+
+async def add_task(
+    name: str,
+    description: str,
+    priority: int = DEFAULT_PRIORITY,
+    due: date | None = None
+) -> int:
+    """
+    Adds a task, normalized and validated like the interactive add_task.
+
+    Args:
+        name (str): Task name.
+        description (str): Task description.
+        priority (int): Priority from 1 (highest) to 5 (lowest).
+        due (date | None): Due date, or None if the task has none.
+
+    Returns:
+        int: ID of the new task.
+
+    Raises:
+        ValueError: If the name or description is empty or too long,
+            or the priority is out of range.
+    """
+    name = name.strip().capitalize()
+    description = description.strip().capitalize()
+    if not (0 < len(name) <= 50 and 0 < len(description) <= 500):
+        raise ValueError(
+            'Name and description cannot be empty '
+            'and must be at most 50 and 500 characters long.'
+        )
+    if priority not in PRIORITIES:
+        raise ValueError('Priority must be a number between 1 and 5.')
+    return await run_db(insert_task, name, description, priority, due)
+
+
+async def get_task(task_id: int) -> tuple | None:
+    """
+    Returns a single task by ID.
+
+    Args:
+        task_id (int): ID of the task.
+
+    Returns:
+        tuple or None: Task record, or None if it does not exist.
+    """
+    return await run_db(fetch_task, task_id, read_only=True)
+
+
+async def list_tasks(**filters) -> list[tuple]:
+    """
+    Returns tasks matching the filters of build_task_query().
+
+    Args:
+        **filters: Keyword arguments of build_task_query().
+
+    Returns:
+        list[tuple]: List of task records.
+    """
+    return await run_db(
+        partial(find_tasks, **filters), read_only=True
+    )
+
+
+async def next_tasks(count: int = PAGE_SIZE) -> list[tuple]:
+    """
+    Returns the next actionable tasks by priority and due date.
+
+    Args:
+        count (int): Maximum number of tasks.
+
+    Returns:
+        list[tuple]: List of task records in working order.
+    """
+    return await run_db(get_next_tasks, count, read_only=True)
+
+
+def change_task(
+    cursor, task_id: int, status: str | None, priority: int | None, due
+) -> bool:
+    """
+    Changes the given fields of a task if it exists, without committing.
+
+    Args:
+        cursor: Database cursor on the primary database.
+        task_id (int): ID of the task.
+        status (str | None): New status, or None to keep it.
+        priority (int | None): New priority, or None to keep it.
+        due (date | None): New due date, None to clear it,
+            or KEEP to keep it.
+
+    Returns:
+        bool: False if the task does not exist.
+    """
+    if not lock_task(cursor, task_id):
+        return False
+    task = fetch_task(cursor, task_id)
+    if status is not None:
+        set_task_status(cursor, task_id, status)
+    if priority is not None or due is not KEEP:
+        set_task_schedule(
+            cursor, task_id,
+            task[5] if priority is None else priority,
+            task[6] if due is KEEP else due
+        )
+    return True
+
+
+async def update_task(
+    task_id: int,
+    status: str | None = None,
+    priority: int | None = None,
+    due=KEEP
+) -> bool:
+    """
+    Changes the status, priority and due date of a task.
+    Fields left at their defaults are kept.
+
+    Args:
+        task_id (int): ID of the task.
+        status (str | None): New status, "In Progress" or "Done"
+            in any letter case, like in the interactive update.
+        priority (int | None): New priority from 1 (highest) to 5.
+        due (date | None): New due date, or None to clear it.
+
+    Returns:
+        bool: False if the task does not exist.
+
+    Raises:
+        ValueError: If nothing is changed, the status is unknown
+            or the priority is out of range.
+    """
+    if status is None and priority is None and due is KEEP:
+        raise ValueError('Nothing to update.')
+    new_status = None
+    if status is not None:
+        new_status = parse_status(status)
+        if new_status is None:
+            raise ValueError('Status must be "In Progress" or "Done".')
+    if priority is not None and priority not in PRIORITIES:
+        raise ValueError('Priority must be a number between 1 and 5.')
+    return await run_db(
+        change_task, task_id, new_status, priority, due
+    )
+
+
+async def delete_task(task_id: int) -> bool:
+    """
+    Deletes a task and records its tombstone.
+
+    Args:
+        task_id (int): ID of the task.
+
+    Returns:
+        bool: False if the task does not exist.
+    """
+    return await run_db(remove_task, task_id)
+
+
+async def run_batch(
+    coroutines, return_exceptions: bool = False
+) -> list:
+    """
+    Runs many operations concurrently, gather-style.
+
+    Concurrency is bounded by the shared thread pool,
+    so large batches queue instead of opening more connections.
+
+    Args:
+        coroutines: Iterable of coroutines from this module.
+        return_exceptions (bool): Whether failures are returned
+            in place of results instead of raised.
+
+    Returns:
+        list: Results in the order of the coroutines.
+    """
+    return await asyncio.gather(
+        *coroutines, return_exceptions=return_exceptions
+    )
+
+
+def benchmark_sync(operations: int, description: str) -> float:
+    """
+    Adds and then reads tasks one by one through the sync path.
+
+    Args:
+        operations (int): Number of tasks to add and read.
+        description (str): Description of the added tasks.
+
+    Returns:
+        float: Elapsed seconds.
+    """
+    started = time.perf_counter()
+    ids = [
+        run_in_session(insert_task, f'Sync {number}', description)
+        for number in range(operations)
+    ]
+    for task_id in ids:
+        run_in_session(fetch_task, task_id, read_only=True)
+    return time.perf_counter() - started
+
+
+async def benchmark_async(operations: int, description: str) -> float:
+    """
+    Adds and then reads tasks concurrently through the async API.
+
+    Args:
+        operations (int): Number of tasks to add and read.
+        description (str): Description of the added tasks.
+
+    Returns:
+        float: Elapsed seconds.
+    """
+    started = time.perf_counter()
+    ids = await run_batch(
+        add_task(f'Async {number}', description)
+        for number in range(operations)
+    )
+    await run_batch(get_task(task_id) for task_id in ids)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    """
+    Command-line entry point comparing sync and async throughput.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(
+        description='Compare sync and async task operation throughput.'
+    )
+    parser.add_argument('--operations', type=int, default=500)
+    args = parser.parse_args()
+
+    create_table()
+    total = args.operations * 2
+    description = f'Benchmark {uuid.uuid4().hex[:8]}'
+    try:
+        sync_seconds = benchmark_sync(args.operations, description)
+        print(f'sync:  {total} ops in {sync_seconds:.2f} s '
+              f'({total / sync_seconds:.1f} ops/s)')
+        async_seconds = asyncio.run(
+            benchmark_async(args.operations, description)
+        )
+        print(f'async: {total} ops in {async_seconds:.2f} s '
+              f'({total / async_seconds:.1f} ops/s, '
+              f'{ASYNC_WORKERS} workers)')
+        print(f'speedup: {sync_seconds / async_seconds:.1f}x')
+    finally:
+        removed = run_in_session(remove_tasks_described, description)
+        print(f'Removed {removed} benchmark tasks.')
+        shutdown()
+
+
+if __name__ == '__main__':
+    main()
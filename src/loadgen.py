@@ -0,0 +1,446 @@
+"""
+Load Generator for the Task Store
+
+This module drives a configurable mix of add, list, filter, update
+and delete operations through the data-access functions of the Task
+Manager from many threads or processes at once. Like the application,
+every operation opens its own connection via get_db_cursor.
+
+It reports throughput, p50/p95/p99 latency and error counts for every
+time interval and for every operation, so it shows where throughput
+stops growing as workers are added.
+
+The 'mysql' backend uses the database from DB_CONFIG (and its read
+replicas). The 'sqlite' backend runs the same functions against
+an embedded SQLite file with a compatible schema and needs no server.
+All tasks of a run share a description with a unique run tag and are
+removed when the run ends, unless --keep is given.
+
+Usage:
+    python -m src.loadgen --backend sqlite --workers 50 --duration 10
+    python -m src.loadgen --backend mysql --mode process --workers 8
+"""
+
+import argparse
+import math
+import os
+import random
+import sqlite3
+import tempfile
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+
+from src.main import (
+    STATUSES, UPDATE_STATUSES, TASK_TABLE_INDEXES, create_table,
+    get_db_cursor, get_tasks, get_tasks_by_status, insert_task,
+    set_task_status, remove_task, remove_tasks_described
+)
+
+OPERATIONS = ('add', 'list', 'filter', 'update', 'delete')
+DEFAULT_MIX = 'add=20,list=10,filter=30,update=25,delete=15'
+SQLITE_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS tasks (
+        ID INTEGER PRIMARY KEY AUTOINCREMENT,
+        Name VARCHAR(50) NOT NULL,
+        Description VARCHAR(500) NOT NULL,
+        Status TEXT NOT NULL DEFAULT 'Not Started',
+        Created DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        Updated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        Tenant VARCHAR(50) NOT NULL DEFAULT '',
+        Priority TINYINT NOT NULL DEFAULT 3,
+        Due DATE NULL,
+        DueOrder DATE GENERATED ALWAYS AS (
+            IFNULL(Due, '9999-12-31')
+            ) STORED,
+        IsOpen INTEGER GENERATED ALWAYS AS (
+            Status <> 'Done'
+            ) STORED
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS task_tombstones (
+        ID INTEGER PRIMARY KEY,
+        Deleted DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    *(
+        f"CREATE INDEX IF NOT EXISTS {name} ON tasks ({indexed})"
+        for name, indexed in TASK_TABLE_INDEXES
+    ),
+)
+
+
+class SQLiteCursor:
+    """
+    Wraps a sqlite3 cursor so it accepts the '%s' placeholders
+    used by the MySQL queries of the Task Manager.
+    """
+
+    def __init__(self, cursor: sqlite3.Cursor):
+        self._cursor = cursor
+
+    def execute(self, query: str, params: tuple = ()) -> None:
+        self._cursor.execute(query.replace('%s', '?'), params)
+
+    def fetchall(self) -> list[tuple]:
+        return self._cursor.fetchall()
+
+    def fetchone(self) -> tuple | None:
+        return self._cursor.fetchone()
+
+    @property
+    def lastrowid(self) -> int:
+        return self._cursor.lastrowid
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    def close(self) -> None:
+        self._cursor.close()
+
+
+@contextmanager
+def get_sqlite_cursor(path: str):
+    """
+    Yields a tuple of (conn, cursor) for the SQLite database
+    and ensures both are closed after use.
+
+    Args:
+        path (str): Path of the SQLite database file.
+
+    Yields:
+        tuple: (conn, cursor) for interacting with the database.
+    """
+    conn = sqlite3.connect(path, timeout=30)
+    cursor = SQLiteCursor(conn.cursor())
+    try:
+        yield conn, cursor
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def open_cursor(settings: dict, read_only: bool):
+    """
+    Returns the cursor context manager of the configured backend.
+
+    Args:
+        settings (dict): Load test settings.
+        read_only (bool): Whether the operation only reads data.
+
+    Returns:
+        Context manager yielding (conn, cursor) or None.
+    """
+    if settings['backend'] == 'sqlite':
+        return get_sqlite_cursor(settings['path'])
+    return get_db_cursor(read_only=read_only)
+
+
+def parse_mix(text: str) -> dict[str, int]:
+    """
+    Parses an operation mix such as 'add=20,list=10'.
+
+    Args:
+        text (str): Comma-separated operation=weight pairs.
+
+    Returns:
+        dict[str, int]: Weight of every operation in the mix.
+
+    Raises:
+        ValueError: If an operation is unknown or no weight is positive.
+    """
+    mix = {}
+    for pair in text.split(','):
+        op, _, weight = pair.partition('=')
+        op = op.strip()
+        if op not in OPERATIONS:
+            raise ValueError(f'Unknown operation "{op}".')
+        mix[op] = int(weight)
+    if sum(mix.values()) <= 0:
+        raise ValueError('At least one operation needs a positive weight.')
+    return mix
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """
+    Returns the nearest-rank percentile of the values.
+
+    Args:
+        values (list[float]): Measured values.
+        pct (float): Percentile between 0 and 100.
+
+    Returns:
+        float: Percentile value, or 0.0 for no values.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def setup_store(settings: dict) -> None:
+    """
+    Creates the schema of the backend and inserts seed tasks.
+
+    Args:
+        settings (dict): Load test settings.
+
+    Returns:
+        None
+    """
+    if settings['backend'] == 'sqlite':
+        with get_sqlite_cursor(settings['path']) as (conn, cursor):
+            cursor.execute("PRAGMA journal_mode=WAL")
+            for statement in SQLITE_SCHEMA:
+                cursor.execute(statement)
+            conn.commit()
+    else:
+        create_table()
+
+    with open_cursor(settings, read_only=False) as cursor_data:
+        if cursor_data is None:
+            raise ConnectionError('Failed to connect to the database.')
+        conn, cursor = cursor_data
+        for number in range(settings['seed_rows']):
+            insert_task(cursor, f'Seed {number}', settings['tag'])
+        conn.commit()
+
+
+def cleanup_store(settings: dict) -> int:
+    """
+    Removes all tasks of the run, recording their tombstones
+    like remove_task does.
+
+    Args:
+        settings (dict): Load test settings.
+
+    Returns:
+        int: Number of removed tasks.
+
+    Raises:
+        ConnectionError: If the database is unreachable.
+    """
+    with open_cursor(settings, read_only=False) as cursor_data:
+        if cursor_data is None:
+            raise ConnectionError('Failed to connect to the database.')
+        conn, cursor = cursor_data
+        removed = remove_tasks_described(cursor, settings['tag'])
+        conn.commit()
+    return removed
+
+
+def run_worker(worker_id: int, settings: dict) -> list[tuple]:
+    """
+    Runs operations in a loop until the test duration is over.
+
+    Update and delete only touch tasks added by this worker;
+    while it has none, they are replaced by an add.
+
+    Args:
+        worker_id (int): Number of the worker.
+        settings (dict): Load test settings.
+
+    Returns:
+        list[tuple]: (seconds since start, operation,
+        latency in seconds, success) for every operation.
+    """
+    rng = random.Random(settings['seed'] + worker_id)
+    operations, weights = zip(*settings['mix'].items())
+    own_ids = []
+    samples = []
+
+    time.sleep(max(settings['start'] - time.time(), 0))
+    deadline = settings['start'] + settings['duration']
+    while (now := time.time()) < deadline:
+        op = rng.choices(operations, weights)[0]
+        if op in ('update', 'delete') and not own_ids:
+            op = 'add'
+        began = time.perf_counter()
+        ok = True
+        try:
+            read_only = op in ('list', 'filter')
+            with open_cursor(settings, read_only) as cursor_data:
+                if cursor_data is None:
+                    raise ConnectionError('Failed to connect to the database.')
+                conn, cursor = cursor_data
+                if op == 'add':
+                    own_ids.append(
+                        insert_task(
+                            cursor, f'Load {worker_id}', settings['tag']
+                        )
+                    )
+                    conn.commit()
+                elif op == 'list':
+                    get_tasks(cursor)
+                elif op == 'filter':
+                    get_tasks_by_status(cursor, rng.choice(STATUSES))
+                elif op == 'update':
+                    set_task_status(
+                        cursor, rng.choice(own_ids),
+                        rng.choice(UPDATE_STATUSES)
+                    )
+                    conn.commit()
+                else:
+                    remove_task(
+                        cursor, own_ids.pop(rng.randrange(len(own_ids)))
+                    )
+                    conn.commit()
+        except Exception:
+            ok = False
+        samples.append(
+            (now - settings['start'], op, time.perf_counter() - began, ok)
+        )
+    return samples
+
+
+def run_load(settings: dict) -> list[tuple]:
+    """
+    Runs all workers in parallel threads or processes.
+
+    Args:
+        settings (dict): Load test settings.
+
+    Returns:
+        list[tuple]: Samples of all workers, see run_worker.
+    """
+    executor_class = (
+        ProcessPoolExecutor if settings['mode'] == 'process'
+        else ThreadPoolExecutor
+    )
+    workers = settings['workers']
+    settings = {**settings, 'start': time.time() + settings['warmup']}
+    with executor_class(max_workers=workers) as executor:
+        results = executor.map(
+            run_worker, range(workers), [settings] * workers
+        )
+        return [sample for samples in results for sample in samples]
+
+
+def format_row(label: str, samples: list[tuple], seconds: float) -> str:
+    """
+    Formats throughput, latency percentiles and errors of the samples.
+
+    Args:
+        label (str): Row label.
+        samples (list[tuple]): Samples to summarize.
+        seconds (float): Length of the period covered by the samples.
+
+    Returns:
+        str: One report line.
+    """
+    latencies = [sample[2] * 1000 for sample in samples]
+    errors = sum(1 for sample in samples if not sample[3])
+    return (
+        f'{label:>10} {len(samples):>8} {len(samples) / seconds:>10.1f} '
+        f'{percentile(latencies, 50):>9.2f} {percentile(latencies, 95):>9.2f} '
+        f'{percentile(latencies, 99):>9.2f} {errors:>7}'
+    )
+
+
+def print_report(samples: list[tuple], settings: dict) -> None:
+    """
+    Prints per-interval and per-operation results.
+
+    Args:
+        samples (list[tuple]): Samples of all workers.
+        settings (dict): Load test settings.
+
+    Returns:
+        None
+    """
+    header = (
+        f'{"":>10} {"ops":>8} {"ops/s":>10} {"p50 ms":>9} '
+        f'{"p95 ms":>9} {"p99 ms":>9} {"errors":>7}'
+    )
+    interval = settings['interval']
+    print(
+        f'{settings["workers"]} {settings["mode"]} workers, '
+        f'backend {settings["backend"]}, {settings["duration"]} s'
+    )
+    print(header)
+    buckets = math.ceil(settings['duration'] / interval)
+    for bucket in range(buckets):
+        selected = [
+            sample for sample in samples
+            if bucket * interval <= sample[0] < (bucket + 1) * interval
+        ]
+        print(format_row(f'{bucket * interval:g}s', selected, interval))
+
+    print('\nBy operation:')
+    print(header)
+    for op in OPERATIONS:
+        selected = [sample for sample in samples if sample[1] == op]
+        if selected:
+            print(format_row(op, selected, settings['duration']))
+    print(format_row('total', samples, settings['duration']))
+
+
+def main() -> None:
+    """
+    Command-line entry point of the load generator.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(
+        description='Parallel load generator for the task store.'
+    )
+    parser.add_argument(
+        '--backend', choices=('mysql', 'sqlite'), default='sqlite'
+    )
+    parser.add_argument(
+        '--sqlite-path', help='SQLite file (default: temporary file)'
+    )
+    parser.add_argument(
+        '--mode', choices=('thread', 'process'), default='thread'
+    )
+    parser.add_argument('--workers', type=int, default=10)
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--interval', type=float, default=1.0)
+    parser.add_argument('--mix', type=parse_mix, default=DEFAULT_MIX)
+    parser.add_argument('--seed-rows', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--keep', action='store_true',
+        help='keep the tasks of the run instead of removing them'
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        settings = {
+            'backend': args.backend,
+            'path': args.sqlite_path or os.path.join(tmp_dir, 'tasks.db'),
+            'mode': args.mode,
+            'workers': args.workers,
+            'duration': args.duration,
+            'interval': args.interval,
+            'mix': args.mix,
+            'seed_rows': args.seed_rows,
+            'seed': args.seed,
+            'warmup': 1.0,
+            'tag': f'Load test {uuid.uuid4().hex[:8]}',
+        }
+        setup_store(settings)
+        try:
+            samples = run_load(settings)
+            print_report(samples, settings)
+        finally:
+            if not args.keep:
+                try:
+                    removed = cleanup_store(settings)
+                    print(
+                        f'\nRemoved {removed} tasks of "{settings["tag"]}".'
+                    )
+                except ConnectionError as e:
+                    print(
+                        f'Failed to remove tasks of "{settings["tag"]}": {e}'
+                    )
+
+
+if __name__ == '__main__':
+    main()
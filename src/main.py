@@ -12,7 +12,11 @@ queries for security.
 """
 
 import os
+import threading
+import time
 from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, datetime, timedelta
 
 from dotenv import load_dotenv
 import mysql.connector
@@ -25,6 +29,65 @@ DB_CONFIG = {
     'password': os.getenv('DB_PASS'),
     'database': os.getenv('DB_NAME')
 }
+REPLICA_CONFIGS = [
+    {**DB_CONFIG, 'host': host.strip()}
+    for host in os.getenv('DB_REPLICA_HOSTS', '').split(',')
+    if host.strip()
+]
+READ_YOUR_WRITES = float(os.getenv('DB_READ_YOUR_WRITES', '5'))
+REPLICA_MAX_LAG = float(os.getenv('DB_REPLICA_MAX_LAG', '5'))
+REPLICA_RETRY_AFTER = 30
+REPLICA_CHECK_INTERVAL = 5
+CHANGE_WINDOW = timedelta(
+    seconds=float(os.getenv('DB_CHANGE_WINDOW', '10'))
+)
+CHANGE_BATCH = 1000
+TASK_COLUMNS = 'ID, Name, Description, Status, Created, Priority, Due'
+STATUSES = ('Not Started', 'In Progress', 'Done')
+UPDATE_STATUSES = ('In Progress', 'Done')
+PRIORITIES = range(1, 6)
+DEFAULT_PRIORITY = 3
+PAGE_SIZE = 10
+SORT_COLUMNS = ('ID', 'Name', 'Status', 'Created')
+TASK_TABLE_COLUMNS = (
+    ('ID', 'INT AUTO_INCREMENT PRIMARY KEY'),
+    ('Name', 'VARCHAR(50) NOT NULL'),
+    ('Description', 'VARCHAR(500) NOT NULL'),
+    ('Status', "ENUM('Not Started', 'Done', 'In Progress') "
+               "DEFAULT 'Not Started' NOT NULL"),
+    ('Created', 'DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP'),
+    ('Updated', 'DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) '
+                'ON UPDATE CURRENT_TIMESTAMP(6)'),
+    ('Tenant', "VARCHAR(50) NOT NULL DEFAULT ''"),
+    ('Priority', 'TINYINT NOT NULL DEFAULT 3'),
+    ('Due', 'DATE NULL'),
+    ('DueOrder', "DATE GENERATED ALWAYS AS (IFNULL(Due, '9999-12-31')) "
+                 "STORED"),
+    ('IsOpen', "TINYINT GENERATED ALWAYS AS (Status <> 'Done') STORED"),
+)
+TASK_TABLE_INDEXES = (
+    ('idx_tasks_updated', 'Updated'),
+    ('idx_tasks_tenant', 'Tenant, Status'),
+    ('idx_tasks_status', 'Status'),
+    ('idx_tasks_status_created', 'Status, Created'),
+    ('idx_tasks_status_name', 'Status, Name'),
+    ('idx_tasks_created', 'Created'),
+    ('idx_tasks_name', 'Name'),
+    ('idx_tasks_open', 'IsOpen, Priority, DueOrder, ID'),
+)
+OBSOLETE_TASK_INDEXES = ('idx_tasks_next',)
+NEXT_TASKS_QUERY = (
+    f"SELECT {TASK_COLUMNS} FROM tasks "
+    "JOIN ("
+    "SELECT ID FROM tasks WHERE IsOpen = 1 "
+    "ORDER BY Priority, DueOrder, ID LIMIT %s"
+    ") AS next_tasks USING (ID) "
+    "ORDER BY Priority, DueOrder, ID"
+)
+
+_replica_lock = threading.Lock()
+_replica_state = {'next': 0, 'down_until': {}, 'checked_until': {}}
+_current_session = ContextVar('task_db_session', default=None)
 
 
 def check_python_version(required=(3, 10)):
@@ -61,17 +124,228 @@ def connect_db() -> MySQLConnection | None:
         return None
 
 
+class Session:
+    """
+    Tracks the commits of one client, so that its reads can go
+    to the primary until replicas have caught up with its writes.
+
+    Args:
+        read_your_writes (float): Seconds after a commit during which
+            reads of this session go to the primary.
+    """
+
+    def __init__(self, read_your_writes: float = READ_YOUR_WRITES):
+        self.read_your_writes = read_your_writes
+        self.last_write = None
+
+    def record_write(self) -> None:
+        """
+        Records that the session has just committed a write.
+
+        Returns:
+            None
+        """
+        self.last_write = time.monotonic()
+
+    def needs_primary(self) -> bool:
+        """
+        Checks whether a recent write may be missing on the replicas.
+
+        Returns:
+            bool: True if reads should go to the primary.
+        """
+        return (
+            self.last_write is not None
+            and time.monotonic() - self.last_write < self.read_your_writes
+        )
+
+
 @contextmanager
-def get_db_cursor():
+def db_session(read_your_writes: float = READ_YOUR_WRITES):
+    """
+    Opts the enclosed calls into read-your-writes: after a commit
+    made through commit(), their reads go to the primary for
+    read_your_writes seconds. Reads outside a session, and reads
+    of other sessions, keep using the replicas.
+
+    Args:
+        read_your_writes (float): Seconds after a commit during which
+            reads of this session go to the primary.
+
+    Yields:
+        Session: The active session.
+    """
+    session = Session(read_your_writes)
+    token = _current_session.set(session)
+    try:
+        yield session
+    finally:
+        _current_session.reset(token)
+
+
+def commit(conn) -> None:
+    """
+    Commits the connection and records the write in the active session.
+
+    Args:
+        conn: Database connection with pending changes.
+
+    Returns:
+        None
+    """
+    conn.commit()
+    session = _current_session.get()
+    if session is not None:
+        session.record_write()
+
+
+def next_replica() -> int | None:
+    """
+    Picks the next healthy read replica in round-robin order.
+
+    Returns:
+        int or None: Index into REPLICA_CONFIGS, or None if reads
+        should go to the primary (no replicas configured, all marked
+        down, or a recent write of the active session needs
+        to be visible).
+    """
+    session = _current_session.get()
+    if session is not None and session.needs_primary():
+        return None
+    with _replica_lock:
+        now = time.monotonic()
+        for _ in range(len(REPLICA_CONFIGS)):
+            index = _replica_state['next'] % len(REPLICA_CONFIGS)
+            _replica_state['next'] = index + 1
+            if _replica_state['down_until'].get(index, 0) <= now:
+                return index
+    return None
+
+
+def mark_replica_down(index: int) -> None:
+    """
+    Excludes a replica from routing for REPLICA_RETRY_AFTER seconds.
+
+    Args:
+        index (int): Index into REPLICA_CONFIGS.
+
+    Returns:
+        None
+    """
+    with _replica_lock:
+        _replica_state['down_until'][index] = (
+            time.monotonic() + REPLICA_RETRY_AFTER
+        )
+        _replica_state['checked_until'].pop(index, None)
+
+
+def replica_lag(conn) -> float | None:
+    """
+    Reads how far a replica is behind its source.
+
+    Args:
+        conn: Connection to the replica.
+
+    Returns:
+        float or None: Seconds behind the source,
+        or None if the server is not replicating.
+    """
+    cursor = conn.cursor(dictionary=True)
+    try:
+        try:
+            cursor.execute("SHOW REPLICA STATUS")
+        except mysql.connector.Error:
+            cursor.execute("SHOW SLAVE STATUS")
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+    lags = [
+        row.get('Seconds_Behind_Source', row.get('Seconds_Behind_Master'))
+        for row in rows
+    ]
+    if not lags or None in lags:
+        return None
+    return float(max(lags))
+
+
+def replica_ready(index: int, conn) -> bool:
+    """
+    Checks that a replica is replicating and at most REPLICA_MAX_LAG
+    seconds behind. A passed check is trusted for
+    REPLICA_CHECK_INTERVAL seconds.
+
+    Args:
+        index (int): Index into REPLICA_CONFIGS.
+        conn: Connection to the replica.
+
+    Returns:
+        bool: True if the replica may serve reads.
+    """
+    now = time.monotonic()
+    with _replica_lock:
+        if _replica_state['checked_until'].get(index, 0) > now:
+            return True
+    host = REPLICA_CONFIGS[index]['host']
+    try:
+        lag = replica_lag(conn)
+    except Exception as e:
+        print(f'Replica {host} health check failed: {e}')
+        return False
+    if lag is None:
+        print(f'Replica {host} is not replicating.')
+        return False
+    if lag > REPLICA_MAX_LAG:
+        print(f'Replica {host} is {lag:.0f} s behind.')
+        return False
+    with _replica_lock:
+        _replica_state['checked_until'][index] = now + REPLICA_CHECK_INTERVAL
+    return True
+
+
+def connect_replica() -> MySQLConnection | None:
+    """
+    Attempts to connect to a healthy read replica, falling back
+    to the primary database if none is available. Replicas that
+    fail to connect or are lagging are marked down.
+
+    Returns:
+        MySQLConnection: Connection object to a replica or the primary,
+        or None if connection fails.
+    """
+    for _ in range(len(REPLICA_CONFIGS)):
+        index = next_replica()
+        if index is None:
+            break
+        conn = None
+        try:
+            conn = mysql.connector.connect(**REPLICA_CONFIGS[index])
+            if conn.is_connected() and replica_ready(index, conn):
+                return conn
+        except Exception as e:
+            print(f'Replica {REPLICA_CONFIGS[index]["host"]} failed: {e}')
+        if conn is not None:
+            conn.close()
+        mark_replica_down(index)
+    return connect_db()
+
+
+@contextmanager
+def get_db_cursor(read_only: bool = False):
     """
     Yields a tuple of (conn, cursor) for database operations
     and ensures both are closed after use.
 
+    Read-only sessions are routed to a read replica,
+    all others go to the primary.
+
+    Args:
+        read_only (bool): Whether the session only reads data.
+
     Yields:
         tuple: (conn, cursor) for interacting with the database,
         or None if connection fails.
     """
-    conn = connect_db()
+    conn = connect_replica() if read_only else connect_db()
     if conn is None:
         print('Failed to connect to the database.')
         yield None
@@ -84,9 +358,96 @@ def get_db_cursor():
         conn.close()
 
 
+def migrate_table(
+    cursor,
+    table: str,
+    columns: tuple,
+    indexes: tuple,
+    obsolete_indexes: tuple = ()
+) -> None:
+    """
+    Brings an existing table up to date with its definition by adding
+    missing columns and indexes and dropping obsolete indexes.
+    Existing ones are looked up in information_schema, so running it
+    again changes nothing.
+
+    Args:
+        cursor: Database cursor to execute the statements.
+        table (str): Name of the table.
+        columns (tuple): (name, definition) of every column, in order.
+        indexes (tuple): (name, indexed columns) of every index.
+        obsolete_indexes (tuple): Names of indexes to drop if present.
+
+    Returns:
+        None
+    """
+    cursor.execute(
+        "SELECT COLUMN_NAME FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+        (table,)
+    )
+    existing_columns = {row[0].lower() for row in cursor.fetchall()}
+    cursor.execute(
+        "SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+        (table,)
+    )
+    existing_indexes = {row[0].lower() for row in cursor.fetchall()}
+
+    changes = [
+        f'DROP INDEX {name}' for name in obsolete_indexes
+        if name.lower() in existing_indexes
+    ]
+    changes += [
+        f'ADD COLUMN {name} {definition}' for name, definition in columns
+        if name.lower() not in existing_columns
+    ]
+    changes += [
+        f'ADD INDEX {name} ({indexed})' for name, indexed in indexes
+        if name.lower() not in existing_indexes
+    ]
+    if changes:
+        cursor.execute(f"ALTER TABLE {table} " + ', '.join(changes))
+
+
+def create_schema(cursor) -> None:
+    """
+    Creates the 'tasks' table and the 'task_tombstones' table
+    of deleted task IDs if they do not exist yet, and migrates
+    tables created by earlier versions to the current definition.
+
+    Args:
+        cursor: Database cursor to execute the statements.
+
+    Returns:
+        None
+    """
+    definitions = [
+        f'{name} {definition}' for name, definition in TASK_TABLE_COLUMNS
+    ] + [
+        f'INDEX {name} ({indexed})' for name, indexed in TASK_TABLE_INDEXES
+    ]
+    cursor.execute(
+        "CREATE TABLE IF NOT EXISTS tasks (" + ', '.join(definitions) + ")"
+    )
+    migrate_table(
+        cursor, 'tasks', TASK_TABLE_COLUMNS, TASK_TABLE_INDEXES,
+        OBSOLETE_TASK_INDEXES
+    )
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS task_tombstones (
+            ID INT PRIMARY KEY,
+            Deleted DATETIME(6) NOT NULL
+                DEFAULT CURRENT_TIMESTAMP(6),
+            INDEX idx_tombstones_deleted (Deleted)
+        )
+    """)
+
+
 def create_table() -> None:
     """
-    Creates the 'tasks' table in the database if it does not exist yet.
+    Creates the application tables in the database
+    if they do not exist yet.
 
     Returns:
         None
@@ -97,22 +458,171 @@ def create_table() -> None:
         conn, cursor = cursor_data
 
         try:
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS tasks (
-                    ID INT AUTO_INCREMENT PRIMARY KEY,
-                    Name VARCHAR(50) NOT NULL,
-                    Description VARCHAR(500) NOT NULL,
-                    Status ENUM(
-                        'Not Started', 'Done', 'In Progress'
-                        ) DEFAULT 'Not Started' NOT NULL,
-                    Created DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
+            create_schema(cursor)
             conn.commit()
         except Exception as e:
             print(f'Error while creating table: {e}')
 
 
+def insert_task(
+    cursor,
+    name: str,
+    description: str,
+    priority: int = DEFAULT_PRIORITY,
+    due: date | None = None
+) -> int:
+    """
+    Inserts a task without committing.
+
+    Args:
+        cursor: Database cursor to execute the query.
+        name (str): Task name.
+        description (str): Task description.
+        priority (int): Priority from 1 (highest) to 5 (lowest).
+        due (date | None): Due date, or None if the task has none.
+
+    Returns:
+        int: ID of the new task.
+    """
+    cursor.execute(
+        "INSERT INTO tasks (Name, Description, Priority, Due) "
+        "VALUES (%s, %s, %s, %s)",
+        (name, description, priority, due),
+    )
+    return cursor.lastrowid
+
+
+def get_tasks_by_status(cursor, status: str) -> list[tuple]:
+    """
+    Returns all tasks with the given status.
+
+    Args:
+        cursor: Database cursor to execute the query.
+        status (str): Status to filter by.
+
+    Returns:
+        list[tuple]: List of task records.
+    """
+    cursor.execute(
+        f"SELECT {TASK_COLUMNS} FROM tasks WHERE Status = %s", (status,)
+    )
+    return cursor.fetchall()
+
+
+def set_task_status(cursor, task_id: int, status: str) -> None:
+    """
+    Sets the status of a task without committing.
+
+    Args:
+        cursor: Database cursor to execute the query.
+        task_id (int): ID of the task.
+        status (str): New status.
+
+    Returns:
+        None
+    """
+    cursor.execute(
+        "UPDATE tasks SET Status = %s WHERE ID = %s", (status, task_id)
+    )
+
+
+def set_task_schedule(
+    cursor, task_id: int, priority: int, due: date | None
+) -> None:
+    """
+    Sets the priority and due date of a task without committing.
+
+    Args:
+        cursor: Database cursor to execute the query.
+        task_id (int): ID of the task.
+        priority (int): Priority from 1 (highest) to 5 (lowest).
+        due (date | None): Due date, or None to clear it.
+
+    Returns:
+        None
+    """
+    cursor.execute(
+        "UPDATE tasks SET Priority = %s, Due = %s WHERE ID = %s",
+        (priority, due, task_id)
+    )
+
+
+def get_next_tasks(cursor, count: int = PAGE_SIZE) -> list[tuple]:
+    """
+    Returns the next actionable tasks: not Done, ordered by priority,
+    then due date (tasks without one last), then ID.
+
+    The inner query reads the IsOpen = 1 range of the covering index
+    idx_tasks_open in order and stops after count entries; full rows
+    are then fetched by primary key for those tasks only.
+
+    Args:
+        cursor: Database cursor to execute the query.
+        count (int): Maximum number of tasks.
+
+    Returns:
+        list[tuple]: List of task records in working order.
+    """
+    cursor.execute(NEXT_TASKS_QUERY, (count,))
+    return cursor.fetchall()
+
+
+def remove_task(cursor, task_id: int) -> bool:
+    """
+    Deletes a task and records its tombstone without committing.
+
+    Args:
+        cursor: Database cursor to execute the queries.
+        task_id (int): ID of the task.
+
+    Returns:
+        bool: True if the task existed and was deleted.
+    """
+    cursor.execute("DELETE FROM tasks WHERE ID = %s", (task_id,))
+    deleted = cursor.rowcount > 0
+    if deleted:
+        cursor.execute(
+            "REPLACE INTO task_tombstones (ID) VALUES (%s)", (task_id,)
+        )
+    return deleted
+
+
+def remove_tasks_described(cursor, description: str) -> int:
+    """
+    Deletes all tasks with the given description and records
+    their tombstones without committing.
+
+    Args:
+        cursor: Database cursor to execute the queries.
+        description (str): Exact description of the tasks.
+
+    Returns:
+        int: Number of deleted tasks.
+    """
+    cursor.execute(
+        "REPLACE INTO task_tombstones (ID) "
+        "SELECT ID FROM tasks WHERE Description = %s",
+        (description,)
+    )
+    cursor.execute("DELETE FROM tasks WHERE Description = %s", (description,))
+    return cursor.rowcount
+
+
+def parse_status(text: str) -> str | None:
+    """
+    Normalizes a status entered for an update.
+
+    Args:
+        text (str): Entered status, in any letter case.
+
+    Returns:
+        str or None: One of UPDATE_STATUSES,
+        or None if the text is not a valid new status.
+    """
+    status = text.strip().title()
+    return status if status in UPDATE_STATUSES else None
+
+
 def menu(menu_text: str, max_option: int) -> int:
     """
     Displays the given menu text and returns a user choice.
@@ -133,10 +643,53 @@ def menu(menu_text: str, max_option: int) -> int:
         print(f'Invalid choice. Enter a number between 1 and {max_option}.')
 
 
+def read_priority(prompt: str, default: int) -> int:
+    """
+    Prompts for a priority until a valid one is entered.
+
+    Args:
+        prompt (str): The text to display.
+        default (int): Priority used when the input is empty.
+
+    Returns:
+        int: Priority from 1 (highest) to 5 (lowest).
+    """
+    while True:
+        value = input(prompt).strip()
+        if not value:
+            return default
+        if value.isdigit() and int(value) in PRIORITIES:
+            return int(value)
+        print('Priority must be a number between 1 and 5.')
+
+
+def read_due(prompt: str, default: date | None) -> date | None:
+    """
+    Prompts for a due date until a valid one is entered.
+
+    Args:
+        prompt (str): The text to display.
+        default (date | None): Due date used when the input is empty.
+
+    Returns:
+        date or None: Due date, or None if 'none' is entered.
+    """
+    while True:
+        value = input(prompt).strip()
+        if not value:
+            return default
+        if value.lower() == 'none':
+            return None
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            print('Due date must be in YYYY-MM-DD format.')
+
+
 def add_task() -> None:
     """
-    Prompts the user to enter a task name and description,
-    and adds it to the 'tasks' table.
+    Prompts the user to enter a task name, description,
+    priority and due date, and adds it to the 'tasks' table.
 
     Returns:
         None
@@ -153,12 +706,16 @@ def add_task() -> None:
                     'Enter task description: '
                     ).strip().capitalize()
                 if 0 < len(name) <= 50 and 0 < len(description) <= 500:
-                    cursor.execute(
-                        "INSERT INTO tasks (Name, Description) "
-                        "VALUES (%s, %s)",
-                        (name, description),
+                    priority = read_priority(
+                        'Enter priority (1 highest - 5 lowest, '
+                        f'Enter for {DEFAULT_PRIORITY}): ',
+                        DEFAULT_PRIORITY
                     )
-                    conn.commit()
+                    due = read_due(
+                        'Enter due date (YYYY-MM-DD, Enter for none): ', None
+                    )
+                    insert_task(cursor, name, description, priority, due)
+                    commit(conn)
                     print(f'Task "{name}" added successfully.')
                     break
                 else:
@@ -180,11 +737,12 @@ def print_tasks(rows: list[tuple]) -> None:
     Returns:
         None
     """
-    for id_, name, description, status, date in rows:
+    for id_, name, description, status, created, priority, due in rows:
         print(f'''
             ID: {id_} | Name: {name} | Status: {status}
+            Priority: {priority} | Due: {due or '-'}
             Description: {description}
-            Created: {date}
+            Created: {created}
             {'_' * 60}
         ''')
 
@@ -200,7 +758,7 @@ def get_tasks(cursor) -> list[tuple] | None:
     Returns:
         list[tuple] or None: List of task records, or None if empty.
     """
-    cursor.execute("SELECT * FROM tasks")
+    cursor.execute(f"SELECT {TASK_COLUMNS} FROM tasks")
     tasks = cursor.fetchall()
     if not tasks:
         print('The list is empty.')
@@ -208,9 +766,385 @@ def get_tasks(cursor) -> list[tuple] | None:
     return tasks
 
 
+def fetch_page(
+    cursor,
+    start_id: int = 0,
+    status: str | None = None,
+    backwards: bool = False,
+    size: int = PAGE_SIZE
+) -> list[tuple]:
+    """
+    Returns one page of tasks ordered by ID.
+
+    Args:
+        cursor: Database cursor to execute the query.
+        start_id (int): First ID of the page, or the ID right after
+            the page when reading backwards.
+        status (str | None): Status to filter by, or None for all tasks.
+        backwards (bool): Whether to read the page before start_id.
+        size (int): Maximum number of tasks on the page.
+
+    Returns:
+        list[tuple]: Task records in ascending ID order.
+    """
+    condition, order = ('ID < %s', 'DESC') if backwards else ('ID >= %s', '')
+    params = (start_id,)
+    if status is not None:
+        condition += ' AND Status = %s'
+        params += (status,)
+    cursor.execute(
+        f"SELECT {TASK_COLUMNS} FROM tasks WHERE {condition} "
+        f"ORDER BY ID {order} LIMIT %s",
+        params + (size,)
+    )
+    rows = cursor.fetchall()
+    return rows[::-1] if backwards else rows
+
+
+def build_task_query(
+    status: str | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    name_prefix: str | None = None,
+    order_by: str = 'ID',
+    descending: bool = False,
+    limit: int | None = None
+) -> tuple[str, tuple]:
+    """
+    Builds one parameterized query combining the given filters.
+
+    Every combination reads through one of the indexes created
+    in create_schema() instead of scanning the table. Without
+    a status filter, or with a range filter on a column other than
+    the sort column, the matching rows are sorted after reading.
+
+    Args:
+        status (str | None): Status to filter by.
+        created_from (datetime | None): Earliest creation time, inclusive.
+        created_to (datetime | None): Latest creation time, exclusive.
+        name_prefix (str | None): Start of the task name.
+        order_by (str): Column to sort by, one of SORT_COLUMNS.
+        descending (bool): Whether to sort in descending order.
+        limit (int | None): Maximum number of tasks, or None for all.
+
+    Returns:
+        tuple: (SQL query, query parameters).
+
+    Raises:
+        ValueError: If the sort column or the limit is invalid.
+    """
+    if order_by not in SORT_COLUMNS:
+        raise ValueError(f'Cannot sort by "{order_by}".')
+    if limit is not None and limit < 1:
+        raise ValueError('Limit must be a positive number.')
+
+    conditions = []
+    params = []
+    if status is not None:
+        conditions.append('Status = %s')
+        params.append(status)
+    if created_from is not None:
+        conditions.append('Created >= %s')
+        params.append(created_from)
+    if created_to is not None:
+        conditions.append('Created < %s')
+        params.append(created_to)
+    if name_prefix:
+        escaped = (
+            name_prefix.replace('\\', '\\\\')
+            .replace('%', '\\%').replace('_', '\\_')
+        )
+        conditions.append('Name LIKE %s')
+        params.append(escaped + '%')
+
+    query = f"SELECT {TASK_COLUMNS} FROM tasks"
+    if conditions:
+        query += ' WHERE ' + ' AND '.join(conditions)
+    direction = 'DESC' if descending else 'ASC'
+    query += f' ORDER BY {order_by} {direction}'
+    if order_by != 'ID':
+        query += f', ID {direction}'
+    if limit is not None:
+        query += ' LIMIT %s'
+        params.append(limit)
+    return query, tuple(params)
+
+
+def find_tasks(cursor, **filters) -> list[tuple]:
+    """
+    Returns tasks matching the filters of build_task_query().
+
+    Args:
+        cursor: Database cursor to execute the query.
+        **filters: Keyword arguments of build_task_query().
+
+    Returns:
+        list[tuple]: List of task records.
+    """
+    cursor.execute(*build_task_query(**filters))
+    return cursor.fetchall()
+
+
+def get_task(cursor, task_id: int) -> tuple | None:
+    """
+    Returns a single task by ID.
+
+    Args:
+        cursor: Database cursor to execute the query.
+        task_id (int): ID of the task.
+
+    Returns:
+        tuple or None: Task record, or None if it does not exist.
+    """
+    cursor.execute(
+        f"SELECT {TASK_COLUMNS} FROM tasks WHERE ID = %s", (task_id,)
+    )
+    return cursor.fetchone()
+
+
+def task_exists(cursor, task_id: int) -> bool:
+    """
+    Checks whether a task with the given ID exists.
+
+    Args:
+        cursor: Database cursor to execute the query.
+        task_id (int): ID of the task.
+
+    Returns:
+        bool: True if the task exists.
+    """
+    cursor.execute("SELECT 1 FROM tasks WHERE ID = %s", (task_id,))
+    return cursor.fetchone() is not None
+
+
+def lock_task(cursor, task_id: int) -> bool:
+    """
+    Locks a task for an update in the current transaction,
+    so it cannot be deleted before the update is committed.
+
+    Args:
+        cursor: Database cursor on the primary database.
+        task_id (int): ID of the task.
+
+    Returns:
+        bool: True if the task exists.
+    """
+    cursor.execute(
+        "SELECT 1 FROM tasks WHERE ID = %s FOR UPDATE", (task_id,)
+    )
+    return cursor.fetchone() is not None
+
+
+class TaskPager:
+    """
+    Shows tasks one page at a time and fetches further pages
+    on demand, keeping only the current page in memory.
+
+    Args:
+        cursor: Database cursor to execute the queries.
+        status (str | None): Status to filter by, or None for all tasks.
+    """
+
+    def __init__(self, cursor, status: str | None = None):
+        self.cursor = cursor
+        self.status = status
+        self.page = []
+
+    def show_first(self) -> bool:
+        """
+        Fetches and prints the first page.
+
+        Returns:
+            bool: False if there are no tasks to show.
+        """
+        self.page = fetch_page(self.cursor, status=self.status)
+        if not self.page:
+            print('The list is empty.')
+            return False
+        print_tasks(self.page)
+        return True
+
+    def ask(self, prompt: str) -> str:
+        """
+        Prompts the user, handling page navigation commands
+        until something else is entered.
+
+        Commands are 'n' (next page), 'p' (previous page)
+        and 'j <ID>' (page starting at the given ID).
+
+        Args:
+            prompt (str): Question shown before the navigation help.
+
+        Returns:
+            str: The first stripped input that is not a command.
+        """
+        while True:
+            answer = input(f'{prompt} (n/p/j <ID> to browse): ').strip()
+            command = answer.lower()
+            if command == 'n':
+                page = fetch_page(
+                    self.cursor, self.page[-1][0] + 1, self.status
+                )
+                empty_message = 'This is the last page.'
+            elif command == 'p':
+                page = fetch_page(
+                    self.cursor, self.page[0][0], self.status, backwards=True
+                )
+                empty_message = 'This is the first page.'
+            elif command[:1] == 'j' and command[1:].strip().isdigit():
+                page = fetch_page(
+                    self.cursor, int(command[1:]), self.status
+                )
+                empty_message = 'No tasks from this ID on.'
+            else:
+                return answer
+
+            if page:
+                self.page = page
+                print_tasks(self.page)
+            else:
+                print(empty_message)
+
+
+def encode_change_token(
+    task_after: tuple | None, tombstone_after: tuple | None
+) -> str | None:
+    """
+    Encodes the change feed positions as a compact string token.
+
+    Args:
+        task_after (tuple | None): (Updated, ID) of the last task read.
+        tombstone_after (tuple | None): (Deleted, ID) of the last
+            tombstone read.
+
+    Returns:
+        str or None: Token like '2024-01-01T10:00:00.000001/42;',
+        or None if nothing has been read yet.
+    """
+    if task_after is None and tombstone_after is None:
+        return None
+    return ';'.join(
+        '' if after is None else f'{after[0].isoformat()}/{after[1]}'
+        for after in (task_after, tombstone_after)
+    )
+
+
+def decode_change_token(token: str | None) -> tuple:
+    """
+    Decodes a token of encode_change_token().
+
+    Args:
+        token (str | None): Change token.
+
+    Returns:
+        tuple: (task position, tombstone position), each an
+        (timestamp, ID) tuple or None.
+
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    if token is None:
+        return None, None
+    parts = token.split(';')
+    if len(parts) != 2:
+        raise ValueError(f'Invalid change token "{token}".')
+    positions = []
+    for part in parts:
+        if not part:
+            positions.append(None)
+            continue
+        stamp, _, task_id = part.rpartition('/')
+        try:
+            positions.append((datetime.fromisoformat(stamp), int(task_id)))
+        except ValueError:
+            raise ValueError(f'Invalid change token "{token}".') from None
+    return tuple(positions)
+
+
+def read_settled(
+    cursor, query: str, stamp: str, after: tuple | None, limit: int
+) -> list[tuple]:
+    """
+    Reads rows in (stamp, ID) order after the given position,
+    up to CHANGE_WINDOW before the current time of the server.
+
+    Args:
+        cursor: Database cursor to execute the query.
+        query (str): SELECT statement without WHERE clause.
+        stamp (str): Name of the change timestamp column.
+        after (tuple | None): (timestamp, ID) of the last row read.
+        limit (int): Maximum number of rows.
+
+    Returns:
+        list[tuple]: Rows ordered by stamp and ID.
+    """
+    conditions = [f'{stamp} < NOW(6) - INTERVAL %s MICROSECOND']
+    params = [int(CHANGE_WINDOW / timedelta(microseconds=1))]
+    if after is not None:
+        conditions.append(f'({stamp}, ID) > (%s, %s)')
+        params.extend(after)
+    cursor.execute(
+        f"{query} WHERE {' AND '.join(conditions)} "
+        f"ORDER BY {stamp}, ID LIMIT %s",
+        (*params, limit)
+    )
+    return cursor.fetchall()
+
+
+def get_changes(
+    cursor, since: str | None = None, limit: int = CHANGE_BATCH
+) -> tuple[list[tuple], list[int], str | None]:
+    """
+    Returns tasks added or updated and IDs of tasks deleted
+    after the given change token.
+
+    'Updated' and 'Deleted' are set when a statement runs, not when
+    its transaction commits, so a change can become visible with an
+    older timestamp than changes already committed. Changes are
+    therefore reported once they are CHANGE_WINDOW old, in (timestamp,
+    ID) order, and the token is the position of the last one reported.
+    Transactions that stay open longer than CHANGE_WINDOW can still
+    be missed.
+
+    Pass the returned token to the next call to receive only new changes;
+    pass None to start from the first task and tombstone. A call returns
+    at most limit tasks and limit tombstones; call again with the new
+    token while it returns that many.
+
+    Args:
+        cursor: Database cursor to execute the queries.
+        since (str | None): Token returned by the previous call.
+        limit (int): Maximum number of tasks and of tombstones.
+
+    Returns:
+        tuple: (changed tasks, deleted IDs, new token).
+
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    task_after, tombstone_after = decode_change_token(since)
+    changed = read_settled(
+        cursor, f"SELECT {TASK_COLUMNS}, Updated FROM tasks",
+        'Updated', task_after, limit
+    )
+    deleted = read_settled(
+        cursor, "SELECT ID, Deleted FROM task_tombstones",
+        'Deleted', tombstone_after, limit
+    )
+    if changed:
+        task_after = (changed[-1][-1], changed[-1][0])
+    if deleted:
+        tombstone_after = (deleted[-1][1], deleted[-1][0])
+    return (
+        [row[:-1] for row in changed],
+        [row[0] for row in deleted],
+        encode_change_token(task_after, tombstone_after),
+    )
+
+
 def display_tasks() -> None:
     """
-    Displays all tasks with optional filtering by status.
+    Displays all tasks page by page with optional filtering by status.
 
     Returns:
         None
@@ -222,17 +1156,17 @@ def display_tasks() -> None:
         '3. In Progress\n'
         '4. Continue without filter\n'
     )
-    with get_db_cursor() as cursor_data:
+    with get_db_cursor(read_only=True) as cursor_data:
         if cursor_data is None:
             return
         conn, cursor = cursor_data
 
         try:
-            tasks = get_tasks(cursor)
-            if not tasks:
-                return
+            pager = TaskPager(cursor)
             print('All tasks:')
-            print_tasks(tasks)
+            if not pager.show_first():
+                return
+            pager.ask('Press Enter to filter by status')
 
             choice = menu(filter_menu_text, 4)
             if choice == 1:
@@ -244,59 +1178,82 @@ def display_tasks() -> None:
             else:
                 return
 
-            cursor.execute("SELECT * FROM tasks WHERE Status = %s", (status,))
-            filtered_tasks = cursor.fetchall()
-            if not filtered_tasks:
-                print('The list is empty.')
-                return
+            pager = TaskPager(cursor, status)
             print(f'Tasks with status "{status}":')
-            print_tasks(filtered_tasks)
+            if not pager.show_first():
+                return
+            pager.ask('Press Enter to return to the menu')
         except Exception as e:
             print(f'Error while displaying tasks: {e}')
 
 
 def update_task():
     """
-    Allows the user to update the status of a selected task.
+    Allows the user to update the status, priority
+    and due date of a selected task. Empty answers keep
+    the current values.
 
     Returns:
         None
     """
-    with get_db_cursor() as cursor_data:
+    with get_db_cursor(read_only=True) as cursor_data:
         if cursor_data is None:
             return
         conn, cursor = cursor_data
 
         try:
-            tasks = get_tasks(cursor)
-            if not tasks:
-                return
+            pager = TaskPager(cursor)
             print('All tasks:')
-            print_tasks(tasks)
+            if not pager.show_first():
+                return
 
-            existing_ids = {str(task[0]) for task in tasks}
             while True:
-                selected_id = input(
-                    'Enter ID of the task to update: '
-                ).strip()
-                if selected_id not in existing_ids:
+                selected_id = pager.ask('Enter ID of the task to update')
+                if not (
+                    selected_id.isdigit()
+                    and task_exists(cursor, int(selected_id))
+                ):
                     print('ID not found.')
                     continue
-                new_status = input(
-                    'Enter new status (In Progress or Done): '
-                    ).strip().title()
-                if new_status not in ['In Progress', 'Done']:
+                task = get_task(cursor, int(selected_id))
+                entered_status = input(
+                    'Enter new status (In Progress or Done, '
+                    f'Enter to keep {task[3]}): '
+                )
+                new_status = parse_status(entered_status)
+                if entered_status.strip() and new_status is None:
                     print('Invalid choice. Enter "In Progress" or "Done".')
                     continue
-                cursor.execute(
-                    "UPDATE tasks SET Status = %s WHERE ID = %s", 
-                    (new_status, int(selected_id))
-                    )
-                conn.commit()
-                print(f'Task ID {selected_id} was successfully updated.')
+                new_priority = read_priority(
+                    f'Enter new priority (1-5, Enter to keep {task[5]}): ',
+                    task[5]
+                )
+                new_due = read_due(
+                    'Enter new due date (YYYY-MM-DD, "none" to clear, '
+                    f'Enter to keep {task[6] or "none"}): ',
+                    task[6]
+                )
                 break
         except Exception as e:
             print(f'Error while updating: {e}')
+            return
+
+    with get_db_cursor() as cursor_data:
+        if cursor_data is None:
+            return
+        conn, cursor = cursor_data
+
+        try:
+            if not lock_task(cursor, int(selected_id)):
+                print('ID not found.')
+                return
+            if new_status is not None:
+                set_task_status(cursor, int(selected_id), new_status)
+            set_task_schedule(cursor, int(selected_id), new_priority, new_due)
+            commit(conn)
+            print(f'Task ID {selected_id} was successfully updated.')
+        except Exception as e:
+            print(f'Error while updating: {e}')
 
 
 def delete_task() -> None:
@@ -306,34 +1263,66 @@ def delete_task() -> None:
     Returns:
         None
     """
-    with get_db_cursor() as cursor_data:
+    with get_db_cursor(read_only=True) as cursor_data:
         if cursor_data is None:
             return
         conn, cursor = cursor_data
 
         try:
-            tasks = get_tasks(cursor)
-            if not tasks:
-                return
+            pager = TaskPager(cursor)
             print('All tasks:')
-            print_tasks(tasks)
+            if not pager.show_first():
+                return
 
-            existing_ids = {str(task[0]) for task in tasks}
             while True:
-                selected_id = input(
-                    'Enter the ID of the task to delete: '
-                    ).strip()
-                if selected_id not in existing_ids:
+                selected_id = pager.ask('Enter the ID of the task to delete')
+                if not (
+                    selected_id.isdigit()
+                    and task_exists(cursor, int(selected_id))
+                ):
                     print('ID not found.')
                     continue
-                cursor.execute(
-                    "DELETE FROM tasks WHERE ID = %s", (int(selected_id),)
-                    )
-                conn.commit()
-                print(f'Task ID {selected_id} was successfully deleted.')
                 break
         except Exception as e:
             print(f'Error while deleting: {e}')
+            return
+
+    with get_db_cursor() as cursor_data:
+        if cursor_data is None:
+            return
+        conn, cursor = cursor_data
+
+        try:
+            if not remove_task(cursor, int(selected_id)):
+                print('ID not found.')
+                return
+            commit(conn)
+            print(f'Task ID {selected_id} was successfully deleted.')
+        except Exception as e:
+            print(f'Error while deleting: {e}')
+
+
+def display_next_tasks() -> None:
+    """
+    Displays the next actionable tasks by priority and due date.
+
+    Returns:
+        None
+    """
+    with get_db_cursor(read_only=True) as cursor_data:
+        if cursor_data is None:
+            return
+        conn, cursor = cursor_data
+
+        try:
+            tasks = get_next_tasks(cursor)
+            if not tasks:
+                print('There are no open tasks.')
+                return
+            print('Next tasks:')
+            print_tasks(tasks)
+        except Exception as e:
+            print(f'Error while displaying next tasks: {e}')
 
 
 def main() -> None:
@@ -350,21 +1339,25 @@ def main() -> None:
         '2. Display Tasks\n'
         '3. Update Task\n'
         '4. Delete Task\n'
-        '5. Exit Program\n'
+        '5. Show Next Tasks\n'
+        '6. Exit Program\n'
     )
-    while True:
-        choice = menu(main_menu_text, 5)
-        if choice == 1:
-            add_task()
-        elif choice == 2:
-            display_tasks()
-        elif choice == 3:
-            update_task()
-        elif choice == 4:
-            delete_task()
-        else:
-            print('Exiting program...')
-            break
+    with db_session():
+        while True:
+            choice = menu(main_menu_text, 6)
+            if choice == 1:
+                add_task()
+            elif choice == 2:
+                display_tasks()
+            elif choice == 3:
+                update_task()
+            elif choice == 4:
+                delete_task()
+            elif choice == 5:
+                display_next_tasks()
+            else:
+                print('Exiting program...')
+                break
 
 
 if __name__ == '__main__':
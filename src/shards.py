@@ -0,0 +1,784 @@
+"""
+Sharded Multi-Tenant Task Storage
+
+This module partitions tasks by tenant across several MySQL databases.
+Each tenant lives on exactly one shard; the tenant-to-shard mapping
+is kept in the 'tenant_shards' directory table on the primary database
+from DB_CONFIG. New tenants are placed by a stable hash of their name.
+
+Shards are configured by the DB_SHARDS environment variable as
+a comma-separated list of 'host/database' entries sharing the DB_USER
+and DB_PASS credentials. Without it, the primary database is the only
+shard.
+
+With several shards, task IDs are taken from a counter on the primary
+database, so they are unique across all shards, also after shards are
+added, and are kept when a tenant is moved. The primary database
+therefore cannot be one of several shards.
+
+Cross-shard listings and status summaries query all shards in parallel.
+A tenant can be moved to another shard from the command line:
+
+    python -m src.shards move <tenant> <shard>
+"""
+
+import argparse
+import os
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import mysql.connector
+from mysql.connector import MySQLConnection
+
+from src.main import (
+    DB_CONFIG, STATUSES, commit, get_db_cursor, create_schema,
+    migrate_table, parse_status
+)
+
+SHARD_CONFIGS = [
+    {
+        **DB_CONFIG,
+        'host': host.strip(),
+        'database': database.strip() or DB_CONFIG['database'],
+    }
+    for host, _, database in (
+        entry.partition('/')
+        for entry in os.getenv('DB_SHARDS', '').split(',')
+        if entry.strip()
+    )
+] or [DB_CONFIG]
+SHARD_COLUMNS = 'ID, Name, Description, Status, Created, Tenant'
+MOVE_COLUMNS = 'ID, Name, Description, Status, Created, Priority, Due, Tenant'
+SHARD_CACHE_TTL = float(os.getenv('DB_SHARD_CACHE_TTL', '60'))
+DIRECTORY_COLUMNS = (
+    ('Tenant', 'VARCHAR(50) PRIMARY KEY'),
+    ('Shard', 'INT NOT NULL'),
+    ('MovingFrom', 'INT NULL'),
+    ('MovingTo', 'INT NULL'),
+)
+MOVE_WAIT = 30
+
+_shard_cache_lock = threading.Lock()
+_shard_cache = {}
+
+
+def check_shards() -> None:
+    """
+    Checks that the primary database is not one of several shards,
+    as its tasks get IDs from its own auto-increment counter.
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: If DB_SHARDS lists the primary database
+            together with other shards.
+    """
+    primary = (DB_CONFIG['host'], DB_CONFIG['database'])
+    if len(SHARD_CONFIGS) > 1 and any(
+        (config['host'], config['database']) == primary
+        for config in SHARD_CONFIGS
+    ):
+        raise ValueError(
+            'The primary database cannot be one of several shards.'
+        )
+
+
+def connect_shard(index: int) -> MySQLConnection | None:
+    """
+    Attempts to establish a connection with the given shard.
+
+    Args:
+        index (int): Index into SHARD_CONFIGS.
+
+    Returns:
+        MySQLConnection: Connection object to the shard,
+        or None if connection fails.
+    """
+    try:
+        return mysql.connector.connect(**SHARD_CONFIGS[index])
+    except Exception as e:
+        print(f'Failed to connect to shard {index}: {e}')
+        return None
+
+
+@contextmanager
+def get_shard_cursor(index: int):
+    """
+    Yields a tuple of (conn, cursor) for the given shard
+    and ensures both are closed after use.
+
+    Args:
+        index (int): Index into SHARD_CONFIGS.
+
+    Yields:
+        tuple: (conn, cursor) for interacting with the shard,
+        or None if connection fails.
+
+    Raises:
+        ValueError: If the shard configuration is invalid.
+    """
+    check_shards()
+    conn = connect_shard(index)
+    if conn is None:
+        yield None
+        return
+    cursor = conn.cursor()
+    try:
+        yield conn, cursor
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def create_shard_tables() -> None:
+    """
+    Creates the task tables on every shard, and the tenant directory
+    and task ID counter on the primary database if they do not exist yet.
+    The counter is moved past the highest task ID found on the shards.
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: If the shard configuration is invalid.
+    """
+    highest = 0
+    for index in range(len(SHARD_CONFIGS)):
+        with get_shard_cursor(index) as cursor_data:
+            if cursor_data is None:
+                continue
+            conn, cursor = cursor_data
+            create_schema(cursor)
+            conn.commit()
+            cursor.execute(
+                "SELECT GREATEST("
+                "(SELECT COALESCE(MAX(ID), 0) FROM tasks), "
+                "(SELECT COALESCE(MAX(ID), 0) FROM task_tombstones))"
+            )
+            highest = max(highest, cursor.fetchone()[0])
+
+    with get_db_cursor() as cursor_data:
+        if cursor_data is None:
+            return
+        conn, cursor = cursor_data
+        definitions = ', '.join(
+            f'{name} {definition}' for name, definition in DIRECTORY_COLUMNS
+        )
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS tenant_shards ({definitions})"
+        )
+        migrate_table(cursor, 'tenant_shards', DIRECTORY_COLUMNS, ())
+        cursor.execute(
+            "CREATE TABLE IF NOT EXISTS task_ids "
+            "(ID INT AUTO_INCREMENT PRIMARY KEY)"
+        )
+        if highest:
+            cursor.execute(
+                "INSERT IGNORE INTO task_ids (ID) VALUES (%s)", (highest,)
+            )
+        conn.commit()
+
+
+def allocate_task_id() -> int | None:
+    """
+    Takes the next task ID from the counter on the primary database.
+    Only the newest row is kept, so that the counter survives restarts
+    of servers that derive it from the highest row.
+
+    Returns:
+        int or None: New task ID, or None if the primary is unreachable.
+    """
+    with get_db_cursor() as cursor_data:
+        if cursor_data is None:
+            return None
+        conn, cursor = cursor_data
+        cursor.execute("INSERT INTO task_ids () VALUES ()")
+        task_id = cursor.lastrowid
+        cursor.execute("DELETE FROM task_ids WHERE ID < %s", (task_id,))
+        commit(conn)
+        return task_id
+
+
+def default_shard(tenant: str) -> int:
+    """
+    Returns the shard a new tenant is placed on.
+
+    Args:
+        tenant (str): Tenant key.
+
+    Returns:
+        int: Index into SHARD_CONFIGS.
+    """
+    return zlib.crc32(tenant.encode()) % len(SHARD_CONFIGS)
+
+
+def forget_shard(tenant: str) -> None:
+    """
+    Drops the cached shard of the tenant, so the next lookup
+    reads the directory again.
+
+    Args:
+        tenant (str): Tenant key.
+
+    Returns:
+        None
+    """
+    with _shard_cache_lock:
+        _shard_cache.pop(tenant, None)
+
+
+def shard_for(tenant: str, fresh: bool = False) -> int | None:
+    """
+    Looks up the tenant's shard in the directory,
+    assigning the default shard to tenants seen for the first time.
+
+    Lookups are read from a replica and cached for SHARD_CACHE_TTL
+    seconds; only new tenants are written to the primary.
+
+    Args:
+        tenant (str): Tenant key.
+        fresh (bool): Whether to skip the cache and read the primary.
+
+    Returns:
+        int or None: Index into SHARD_CONFIGS,
+        or None if the directory is unreachable.
+    """
+    now = time.monotonic()
+    with _shard_cache_lock:
+        cached = _shard_cache.get(tenant)
+    if not fresh and cached is not None and cached[1] > now:
+        return cached[0]
+
+    with get_db_cursor(read_only=not fresh) as cursor_data:
+        if cursor_data is None:
+            return None
+        conn, cursor = cursor_data
+        cursor.execute(
+            "SELECT Shard FROM tenant_shards WHERE Tenant = %s", (tenant,)
+        )
+        row = cursor.fetchone()
+    if row is None:
+        row = assign_shard(tenant)
+        if row is None:
+            return None
+    with _shard_cache_lock:
+        _shard_cache[tenant] = (row[0], now + SHARD_CACHE_TTL)
+    return row[0]
+
+
+def assign_shard(tenant: str) -> tuple | None:
+    """
+    Assigns the default shard to a new tenant on the primary,
+    keeping the assignment of a concurrent first lookup.
+
+    Args:
+        tenant (str): Tenant key.
+
+    Returns:
+        tuple or None: (Shard,) row of the tenant,
+        or None if the directory is unreachable.
+    """
+    with get_db_cursor() as cursor_data:
+        if cursor_data is None:
+            return None
+        conn, cursor = cursor_data
+        cursor.execute(
+            "INSERT IGNORE INTO tenant_shards (Tenant, Shard) "
+            "VALUES (%s, %s)",
+            (tenant, default_shard(tenant))
+        )
+        commit(conn)
+        cursor.execute(
+            "SELECT Shard FROM tenant_shards WHERE Tenant = %s", (tenant,)
+        )
+        return cursor.fetchone()
+
+
+@contextmanager
+def get_tenant_cursor(
+    tenant: str, for_write: bool = False, fresh: bool = False
+):
+    """
+    Yields a tuple of (conn, cursor) for the shard holding the tenant.
+
+    Writing sessions hold a shared lock on the tenant's directory row
+    until they finish. While the tenant is being moved they wait up to
+    MOVE_WAIT seconds for move_tenant() and then use the new shard.
+
+    Args:
+        tenant (str): Tenant key.
+        for_write (bool): Whether the session changes the tenant's tasks.
+        fresh (bool): Whether to read the shard from the primary
+            instead of the cache.
+
+    Yields:
+        tuple: (conn, cursor) for interacting with the shard,
+        or None if the shard cannot be resolved or reached.
+    """
+    index = shard_for(tenant, fresh)
+    if index is None:
+        yield None
+        return
+    if not for_write:
+        with get_shard_cursor(index) as cursor_data:
+            yield cursor_data
+        return
+
+    with get_db_cursor() as directory_data:
+        if directory_data is None:
+            yield None
+            return
+        directory_conn, directory_cursor = directory_data
+        deadline = time.monotonic() + MOVE_WAIT
+        while True:
+            directory_cursor.execute(
+                "SELECT Shard, MovingTo FROM tenant_shards "
+                "WHERE Tenant = %s LOCK IN SHARE MODE",
+                (tenant,)
+            )
+            index, moving_to = directory_cursor.fetchone()
+            if moving_to is None:
+                break
+            directory_conn.rollback()
+            if time.monotonic() >= deadline:
+                print(f'Tenant "{tenant}" is being moved, try again later.')
+                yield None
+                return
+            time.sleep(0.1)
+        with get_shard_cursor(index) as cursor_data:
+            yield cursor_data
+        directory_conn.rollback()
+
+
+def add_tenant_task(tenant: str, name: str, description: str) -> int | None:
+    """
+    Adds a task for the tenant on its shard. With several shards
+    the ID is taken from allocate_task_id(), with a single one
+    from the shard's auto-increment counter.
+
+    Args:
+        tenant (str): Tenant key.
+        name (str): Task name.
+        description (str): Task description.
+
+    Returns:
+        int or None: ID of the new task, or None on failure.
+    """
+    task_id = None
+    if len(SHARD_CONFIGS) > 1:
+        task_id = allocate_task_id()
+        if task_id is None:
+            return None
+    with get_tenant_cursor(tenant, for_write=True) as cursor_data:
+        if cursor_data is None:
+            return None
+        conn, cursor = cursor_data
+        cursor.execute(
+            "INSERT INTO tasks (ID, Name, Description, Tenant) "
+            "VALUES (%s, %s, %s, %s)",
+            (task_id, name, description, tenant)
+        )
+        conn.commit()
+        return task_id if task_id is not None else cursor.lastrowid
+
+
+def get_tenant_tasks(tenant: str) -> list[tuple]:
+    """
+    Returns all tasks of the tenant. An empty result of the cached
+    shard is checked on the shard read from the primary, in case
+    the tenant was moved by another process since it was cached.
+
+    Args:
+        tenant (str): Tenant key.
+
+    Returns:
+        list[tuple]: Task records with the tenant as last column.
+    """
+    for fresh in (False, True):
+        with get_tenant_cursor(tenant, fresh=fresh) as cursor_data:
+            if cursor_data is None:
+                return []
+            conn, cursor = cursor_data
+            cursor.execute(
+                f"SELECT {SHARD_COLUMNS} FROM tasks WHERE Tenant = %s "
+                "ORDER BY ID",
+                (tenant,)
+            )
+            rows = cursor.fetchall()
+        if rows:
+            break
+    return rows
+
+
+def update_tenant_task(tenant: str, task_id: int, status: str) -> bool:
+    """
+    Sets the status of one of the tenant's tasks.
+
+    Args:
+        tenant (str): Tenant key.
+        task_id (int): ID of the task on the tenant's shard.
+        status (str): New status, in any letter case.
+
+    Returns:
+        bool: True if the task was found and updated.
+
+    Raises:
+        ValueError: If the status is not a valid new status.
+    """
+    new_status = parse_status(status)
+    if new_status is None:
+        raise ValueError('Status must be "In Progress" or "Done".')
+    with get_tenant_cursor(tenant, for_write=True) as cursor_data:
+        if cursor_data is None:
+            return False
+        conn, cursor = cursor_data
+        cursor.execute(
+            "UPDATE tasks SET Status = %s WHERE ID = %s AND Tenant = %s",
+            (new_status, task_id, tenant)
+        )
+        conn.commit()
+        return cursor.rowcount > 0
+
+
+def delete_tenant_task(tenant: str, task_id: int) -> bool:
+    """
+    Deletes one of the tenant's tasks and records its tombstone.
+
+    Args:
+        tenant (str): Tenant key.
+        task_id (int): ID of the task on the tenant's shard.
+
+    Returns:
+        bool: True if the task was found and deleted.
+    """
+    with get_tenant_cursor(tenant, for_write=True) as cursor_data:
+        if cursor_data is None:
+            return False
+        conn, cursor = cursor_data
+        cursor.execute(
+            "DELETE FROM tasks WHERE ID = %s AND Tenant = %s",
+            (task_id, tenant)
+        )
+        deleted = cursor.rowcount > 0
+        if deleted:
+            cursor.execute(
+                "REPLACE INTO task_tombstones (ID) VALUES (%s)", (task_id,)
+            )
+        conn.commit()
+        return deleted
+
+
+def fan_out(query: str, params: tuple = ()) -> list[list[tuple]]:
+    """
+    Runs a read query on every shard in parallel.
+
+    Args:
+        query (str): SQL query to run.
+        params (tuple): Query parameters.
+
+    Returns:
+        list[list[tuple]]: Rows returned by each shard, in shard order.
+
+    Raises:
+        ConnectionError: If any shard is unreachable, naming all of them,
+            so that partial results are never mistaken for complete ones.
+    """
+    def run(index: int) -> list[tuple] | None:
+        with get_shard_cursor(index) as cursor_data:
+            if cursor_data is None:
+                return None
+            conn, cursor = cursor_data
+            cursor.execute(query, params)
+            return cursor.fetchall()
+
+    with ThreadPoolExecutor(max_workers=len(SHARD_CONFIGS)) as executor:
+        results = list(executor.map(run, range(len(SHARD_CONFIGS))))
+    failed = [str(index) for index, rows in enumerate(results) if rows is None]
+    if failed:
+        raise ConnectionError(f'Unreachable shards: {", ".join(failed)}.')
+    return results
+
+
+def tenant_directory() -> dict[str, int]:
+    """
+    Reads the shard of every tenant from the primary database.
+
+    Returns:
+        dict[str, int]: Index into SHARD_CONFIGS for every tenant.
+
+    Raises:
+        ConnectionError: If the directory is unreachable.
+    """
+    with get_db_cursor() as cursor_data:
+        if cursor_data is None:
+            raise ConnectionError('Tenant directory is unreachable.')
+        conn, cursor = cursor_data
+        cursor.execute("SELECT Tenant, Shard FROM tenant_shards")
+        return dict(cursor.fetchall())
+
+
+def fan_out_owned(query: str, params: tuple = ()) -> list[tuple]:
+    """
+    Runs a read query on every shard in parallel and keeps only rows
+    of tenants that the directory maps to the shard returning them,
+    so copies of a tenant being moved are not counted twice.
+
+    The directory is read again after the query, which is repeated
+    if a move switched a tenant to another shard in the meantime.
+
+    Args:
+        query (str): SQL query returning the tenant as its last column.
+        params (tuple): Query parameters.
+
+    Returns:
+        list[tuple]: Rows of the owning shards.
+
+    Raises:
+        ConnectionError: If any shard or the directory is unreachable.
+    """
+    directory = tenant_directory()
+    for _ in range(3):
+        results = fan_out(query, params)
+        current = tenant_directory()
+        if current == directory:
+            break
+        directory = current
+    return [
+        row
+        for index, shard_rows in enumerate(results)
+        for row in shard_rows
+        if directory.get(row[-1], index) == index
+    ]
+
+
+def list_all_tasks() -> list[tuple]:
+    """
+    Returns the tasks of all tenants across all shards.
+
+    Returns:
+        list[tuple]: Task records ordered by tenant and ID.
+
+    Raises:
+        ConnectionError: If any shard is unreachable.
+    """
+    rows = fan_out_owned(f"SELECT {SHARD_COLUMNS} FROM tasks")
+    return sorted(rows, key=lambda row: (row[-1], row[0]))
+
+
+def status_summary() -> dict[str, int]:
+    """
+    Counts tasks by status across all shards.
+
+    Returns:
+        dict[str, int]: Number of tasks for every status,
+        including unknown statuses found on the shards.
+
+    Raises:
+        ConnectionError: If any shard is unreachable.
+    """
+    summary = dict.fromkeys(STATUSES, 0)
+    rows = fan_out_owned(
+        "SELECT Status, COUNT(*), Tenant FROM tasks GROUP BY Tenant, Status"
+    )
+    for status, count, tenant in rows:
+        summary[status] = summary.get(status, 0) + count
+    return summary
+
+
+def clear_tenant(index: int, tenant: str) -> None:
+    """
+    Deletes all rows of the tenant from a shard after it was moved
+    away, recording their tombstones for readers of the shard's
+    change feed.
+
+    Args:
+        index (int): Index into SHARD_CONFIGS.
+        tenant (str): Tenant key.
+
+    Returns:
+        None
+
+    Raises:
+        ConnectionError: If the shard is unreachable.
+    """
+    with get_shard_cursor(index) as cursor_data:
+        if cursor_data is None:
+            raise ConnectionError(f'Shard {index} is unreachable.')
+        conn, cursor = cursor_data
+        cursor.execute(
+            "REPLACE INTO task_tombstones (ID) "
+            "SELECT ID FROM tasks WHERE Tenant = %s",
+            (tenant,)
+        )
+        cursor.execute("DELETE FROM tasks WHERE Tenant = %s", (tenant,))
+        conn.commit()
+
+
+def copy_tenant(tenant: str, source: int, target: int) -> int:
+    """
+    Copies all tasks of the tenant to another shard, keeping their IDs
+    and replacing rows of the tenant already on the target. Replaced
+    rows missing from the source get tombstones on the target, and
+    tombstones of the copied IDs are removed.
+
+    Args:
+        tenant (str): Tenant key.
+        source (int): Index of the shard to copy from.
+        target (int): Index of the shard to copy to.
+
+    Returns:
+        int: Number of tasks copied.
+
+    Raises:
+        ConnectionError: If a shard is unreachable.
+    """
+    with get_shard_cursor(source) as source_data, \
+            get_shard_cursor(target) as target_data:
+        if source_data is None or target_data is None:
+            raise ConnectionError('Shard is unreachable.')
+        source_conn, source_cursor = source_data
+        target_conn, target_cursor = target_data
+
+        source_cursor.execute(
+            f"SELECT {MOVE_COLUMNS} FROM tasks WHERE Tenant = %s", (tenant,)
+        )
+        rows = source_cursor.fetchall()
+        target_cursor.execute(
+            "REPLACE INTO task_tombstones (ID) "
+            "SELECT ID FROM tasks WHERE Tenant = %s",
+            (tenant,)
+        )
+        target_cursor.execute(
+            "DELETE FROM tasks WHERE Tenant = %s", (tenant,)
+        )
+        if rows:
+            target_cursor.executemany(
+                f"INSERT INTO tasks ({MOVE_COLUMNS}) "
+                "VALUES (%s, %s, %s, %s, %s, %s, %s, %s)",
+                rows
+            )
+            target_cursor.executemany(
+                "DELETE FROM task_tombstones WHERE ID = %s",
+                [(row[0],) for row in rows]
+            )
+        target_conn.commit()
+    return len(rows)
+
+
+def move_tenant(tenant: str, target: int) -> int:
+    """
+    Moves all tasks of the tenant to another shard, keeping their IDs.
+
+    The target is recorded in MovingTo before the tasks are copied, so
+    writes for the tenant wait and listings ignore the copy until the
+    directory switches to the target. The source is then kept in
+    MovingFrom until its rows are deleted. Running any move of the
+    tenant again first removes the rows left by an interrupted one;
+    a named lock keeps two moves of the same tenant from overlapping.
+
+    Args:
+        tenant (str): Tenant key.
+        target (int): Index into SHARD_CONFIGS.
+
+    Returns:
+        int: Number of tasks moved.
+
+    Raises:
+        ValueError: If the target shard does not exist.
+        RuntimeError: If the tenant is already being moved.
+        ConnectionError: If a shard or the directory is unreachable.
+    """
+    if target not in range(len(SHARD_CONFIGS)):
+        raise ValueError(f'Unknown shard {target}.')
+    if shard_for(tenant) is None:
+        raise ConnectionError('Tenant directory is unreachable.')
+
+    with get_db_cursor() as cursor_data:
+        if cursor_data is None:
+            raise ConnectionError('Tenant directory is unreachable.')
+        conn, cursor = cursor_data
+        cursor.execute(
+            "SELECT GET_LOCK(%s, 0)", (f'move_tenant:{tenant}',)
+        )
+        if cursor.fetchone()[0] != 1:
+            raise RuntimeError(f'Tenant "{tenant}" is already being moved.')
+        cursor.execute(
+            "SELECT Shard, MovingFrom, MovingTo FROM tenant_shards "
+            "WHERE Tenant = %s FOR UPDATE",
+            (tenant,)
+        )
+        source, moving_from, moving_to = cursor.fetchone()
+        for leftover in (moving_from, moving_to):
+            if leftover is not None:
+                clear_tenant(leftover, tenant)
+        cursor.execute(
+            "UPDATE tenant_shards SET MovingFrom = NULL, MovingTo = %s "
+            "WHERE Tenant = %s",
+            (None if source == target else target, tenant)
+        )
+        commit(conn)
+        if source == target:
+            return 0
+
+        moved = copy_tenant(tenant, source, target)
+        cursor.execute(
+            "UPDATE tenant_shards "
+            "SET Shard = %s, MovingFrom = %s, MovingTo = NULL "
+            "WHERE Tenant = %s",
+            (target, source, tenant)
+        )
+        commit(conn)
+        forget_shard(tenant)
+
+        clear_tenant(source, tenant)
+        cursor.execute(
+            "UPDATE tenant_shards SET MovingFrom = NULL WHERE Tenant = %s",
+            (tenant,)
+        )
+        commit(conn)
+    return moved
+
+
+def main() -> None:
+    """
+    Command-line entry point for shard maintenance.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(
+        description='Sharded task storage maintenance.'
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('init', help='create directory and shard tables')
+    commands.add_parser('summary', help='count tasks by status')
+    move = commands.add_parser('move', help='move a tenant to a shard')
+    move.add_argument('tenant')
+    move.add_argument('shard', type=int)
+    args = parser.parse_args()
+
+    if args.command == 'init':
+        create_shard_tables()
+    elif args.command == 'summary':
+        try:
+            summary = status_summary()
+        except ConnectionError as e:
+            print(f'Failed to summarize tasks: {e}')
+            return
+        for status, count in summary.items():
+            print(f'{status}: {count}')
+    else:
+        try:
+            moved = move_tenant(args.tenant, args.shard)
+        except (ValueError, RuntimeError, ConnectionError) as e:
+            print(f'Failed to move tenant: {e}')
+            return
+        print(f'Moved {moved} tasks of "{args.tenant}" to shard {args.shard}.')
+
+
+if __name__ == '__main__':
+    main()
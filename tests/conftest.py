@@ -37,7 +37,9 @@ def connect_test_db() -> MySQLConnection | None:
 def patch_connect_db(monkeypatch):
     """
     Automatically patches the original database connection
-    function to use the test database.
+    function to use the test database, and disables the read
+    replicas configured for the application so that read-only
+    sessions use the test database as well.
 
     Args:
         monkeypatch: Pytest fixture for patching.
@@ -47,30 +49,29 @@ def patch_connect_db(monkeypatch):
     """
     import src.main as main
     monkeypatch.setattr(main, 'connect_db', connect_test_db)
+    monkeypatch.setattr(main, 'REPLICA_CONFIGS', [])
 
 
 @pytest.fixture(autouse=True)
-def reset_test_table():
+def reset_test_table(patch_connect_db):
     """
-    Resets the tasks table in the test database
-    before each test by dropping and recreating it.
+    Resets the test database before each test by dropping
+    the tables and recreating them with the application schema.
+
+    Args:
+        patch_connect_db: Fixture redirecting connections to the test DB.
 
     Returns:
         None
     """
+    import src.main as main
     conn = connect_test_db()
     cursor = conn.cursor()
-    cursor.execute("DROP TABLE IF EXISTS tasks")
-    cursor.execute("""
-        CREATE TABLE tasks (
-            ID INT AUTO_INCREMENT PRIMARY KEY,
-            Name VARCHAR(50) NOT NULL,
-            Description VARCHAR(500) NOT NULL,
-            Status ENUM('Not Started', 'Done', 'In Progress') 
-                DEFAULT 'Not Started' NOT NULL,
-            Created DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
+    cursor.execute(
+        "DROP TABLE IF EXISTS tasks, task_tombstones, tenant_shards, "
+        "task_ids"
+    )
     conn.commit()
     cursor.close()
     conn.close()
+    main.create_table()
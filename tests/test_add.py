@@ -41,7 +41,8 @@ def test_add_task_negative(
         None
     """
     inputs = iter(
-        [invalid_name, invalid_description, valid_name, valid_description]
+        [invalid_name, invalid_description,
+         valid_name, valid_description, '', '']
     )
     monkeypatch.setattr('builtins.input', lambda _: next(inputs))
     add_task()
@@ -82,7 +83,7 @@ def test_add_task_positive(
     Returns:
         None
     """
-    inputs = iter([valid_name, valid_description])
+    inputs = iter([valid_name, valid_description, '', ''])
     monkeypatch.setattr('builtins.input', lambda _: next(inputs))
 
     add_task()
@@ -122,7 +123,10 @@ def test_add_task_output(
     Returns:
         None
     """
-    inputs = iter([valid_name, valid_description, 'Pet time', 'Walk ducks'])
+    inputs = iter(
+        [valid_name, valid_description, '', '',
+         'Pet time', 'Walk ducks', '', '']
+    )
     monkeypatch.setattr('builtins.input', lambda _: next(inputs))
     printed = []
     monkeypatch.setattr('builtins.print', printed.append)
@@ -0,0 +1,215 @@
+"""
+Unit tests for the asyncio data-access API of the Task Manager
+application. These tests verify the coroutine operations,
+their validation and concurrent batches.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+
+import src.async_api as api
+
+
+@pytest.fixture(autouse=True)
+def shutdown_executor():
+    """
+    Shuts the shared thread pool down after each test.
+
+    Yields:
+        None
+    """
+    yield
+    api.shutdown()
+
+
+def test_async_crud() -> None:
+    """
+    Tests adding, reading, listing, updating and deleting a task.
+
+    Returns:
+        None
+    """
+    async def scenario():
+        task_id = await api.add_task(' pet tIme ', 'walk duCks')
+        task = await api.get_task(task_id)
+        assert task[1:4] == ('Pet time', 'Walk ducks', 'Not Started')
+
+        assert await api.update_task(task_id, ' in progress ')
+        assert (await api.get_task(task_id))[3] == 'In Progress'
+        assert await api.update_task(task_id, 'Done')
+        assert [t[0] for t in await api.list_tasks(status='Done')] == [
+            task_id
+        ]
+
+        assert await api.delete_task(task_id)
+        assert await api.get_task(task_id) is None
+        assert not await api.update_task(task_id, 'Done')
+        assert not await api.delete_task(task_id)
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize(
+    'name, description',
+    [('', 'Walk ducks'), ('Pet time', ''), ('a' * 51, 'd'), ('a', 'd' * 501)]
+)
+def test_async_add_task_negative(name: str, description: str) -> None:
+    """
+    Tests that invalid task inputs are rejected.
+
+    Args:
+        name (str): Task name.
+        description (str): Task description.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ValueError):
+        asyncio.run(api.add_task(name, description))
+
+
+@pytest.mark.parametrize('status', ['Finished', 'Not Started', ''])
+def test_async_update_task_invalid_status(status: str) -> None:
+    """
+    Tests that statuses the interactive update rejects
+    are rejected as well.
+
+    Args:
+        status (str): Invalid new status.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ValueError):
+        asyncio.run(api.update_task(1, status))
+
+
+def test_run_batch() -> None:
+    """
+    Tests that a concurrent batch adds every task
+    and returns results in order.
+
+    Returns:
+        None
+    """
+    async def scenario():
+        ids = await api.run_batch(
+            api.add_task(f'Task {number}', 'Walk ducks')
+            for number in range(50)
+        )
+        tasks = await api.run_batch(api.get_task(task_id) for task_id in ids)
+        return ids, tasks
+
+    ids, tasks = asyncio.run(scenario())
+    assert len(set(ids)) == 50
+    assert [task[1] for task in tasks] == [
+        f'Task {number}' for number in range(50)
+    ]
+
+
+def test_async_next_tasks() -> None:
+    """
+    Tests adding scheduled tasks and reading them in working order.
+
+    Returns:
+        None
+    """
+    async def scenario():
+        await api.add_task('Later', 'Walk ducks', 2)
+        await api.add_task('Sooner', 'Walk ducks', 1, date(2030, 1, 1))
+        return await api.next_tasks()
+
+    assert [task[1] for task in asyncio.run(scenario())] == [
+        'Sooner', 'Later'
+    ]
+
+
+@pytest.mark.parametrize('priority', [0, 6])
+def test_async_add_task_invalid_priority(priority: int) -> None:
+    """
+    Tests that priorities outside 1-5 are rejected.
+
+    Args:
+        priority (int): Invalid priority.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ValueError):
+        asyncio.run(api.add_task('Pet time', 'Walk ducks', priority))
+
+
+def test_benchmark_cleanup(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that the benchmark removes its tasks and leaves others alone.
+
+    Args:
+        monkeypatch: Pytest fixture for patching.
+
+    Returns:
+        None
+    """
+    asyncio.run(api.add_task('Pet time', 'Walk ducks'))
+    monkeypatch.setattr('sys.argv', ['async_api', '--operations', '5'])
+    monkeypatch.setattr('builtins.print', lambda *args: None)
+
+    api.main()
+    tasks = asyncio.run(api.list_tasks(limit=None))
+    assert [task[1] for task in tasks] == ['Pet time']
+
+
+def test_async_update_task_schedule() -> None:
+    """
+    Tests changing, keeping and clearing the priority and due date.
+
+    Returns:
+        None
+    """
+    async def scenario():
+        task_id = await api.add_task('Pet time', 'Walk ducks', 2)
+        assert await api.update_task(
+            task_id, priority=1, due=date(2030, 1, 31)
+        )
+        first = await api.get_task(task_id)
+        assert await api.update_task(task_id, 'done')
+        second = await api.get_task(task_id)
+        assert await api.update_task(task_id, due=None)
+        third = await api.get_task(task_id)
+        return first, second, third
+
+    first, second, third = asyncio.run(scenario())
+    assert first[3] == 'Not Started' and first[5:] == (1, date(2030, 1, 31))
+    assert second[3] == 'Done' and second[5:] == (1, date(2030, 1, 31))
+    assert third[5:] == (1, None)
+
+
+@pytest.mark.parametrize(
+    'changes', [{}, {'priority': 0}, {'priority': 6}, {'status': 'Finished'}]
+)
+def test_async_update_task_negative(changes: dict) -> None:
+    """
+    Tests that empty updates and invalid values are rejected.
+
+    Args:
+        changes (dict): Keyword arguments for update_task.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ValueError):
+        asyncio.run(api.update_task(1, **changes))
+
+
+def test_get_executor_shared_across_threads() -> None:
+    """
+    Tests that threads asking for the pool at once share one pool.
+
+    Returns:
+        None
+    """
+    with ThreadPoolExecutor(max_workers=8) as callers:
+        executors = list(callers.map(lambda _: api.get_executor(), range(8)))
+    assert len({id(executor) for executor in executors}) == 1
@@ -0,0 +1,214 @@
+"""
+Unit tests for the incremental change feed of the Task Manager
+application. These tests verify that only tasks changed after
+a token are returned, that deletions are reported as tombstones
+and that changes are only reported once they are CHANGE_WINDOW old.
+"""
+
+from datetime import timedelta
+
+import pytest
+
+import src.main as main
+from src.main import (
+    get_db_cursor, add_task, update_task, delete_task, get_changes
+)
+
+
+@pytest.fixture(autouse=True)
+def no_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Reports changes right after they are committed.
+
+    Args:
+        monkeypatch: Pytest fixture for patching.
+
+    Returns:
+        None
+    """
+    monkeypatch.setattr(main, 'CHANGE_WINDOW', timedelta(0))
+
+
+def read_changes(since: str | None = None, limit: int = main.CHANGE_BATCH):
+    """
+    Reads the change feed with a fresh cursor.
+
+    Args:
+        since (str | None): Change token returned by a previous read.
+        limit (int): Maximum number of tasks and of tombstones.
+
+    Returns:
+        tuple: (changed tasks, deleted IDs, new token).
+    """
+    with get_db_cursor() as cursor_data:
+        conn, cursor = cursor_data
+        return get_changes(cursor, since, limit)
+
+
+def insert_aged(name: str, age: str) -> None:
+    """
+    Inserts a task whose Updated timestamp lies in the past,
+    like one written by a transaction that commits late.
+
+    Args:
+        name (str): Task name.
+        age (str): MySQL interval, for example '30 MINUTE'.
+
+    Returns:
+        None
+    """
+    with get_db_cursor() as cursor_data:
+        conn, cursor = cursor_data
+        cursor.execute(
+            "INSERT INTO tasks (Name, Description, Updated) "
+            f"VALUES (%s, 'Walk ducks', NOW(6) - INTERVAL {age})",
+            (name,)
+        )
+        conn.commit()
+
+
+def test_get_changes_empty() -> None:
+    """
+    Tests that an empty table yields no changes and no token.
+
+    Returns:
+        None
+    """
+    assert read_changes() == ([], [], None)
+
+
+def test_get_changes_insert(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that added tasks are returned once and not repeated
+    after the returned token.
+
+    Args:
+        monkeypatch: Pytest fixture to simulate user input.
+
+    Returns:
+        None
+    """
+    inputs = iter(
+        ['Pet time', 'Walk ducks', '', '', 'Feed', 'Feed ducks', '', '']
+    )
+    monkeypatch.setattr('builtins.input', lambda _: next(inputs))
+
+    add_task()
+    changed, deleted, token = read_changes()
+    assert [task[1] for task in changed] == ['Pet time']
+    assert deleted == []
+
+    add_task()
+    changed, deleted, token = read_changes(token)
+    assert [task[1] for task in changed] == ['Feed']
+
+    assert read_changes(token) == ([], [], token)
+
+
+def test_get_changes_update(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that an updated task appears in the feed after the token.
+
+    Args:
+        monkeypatch: Pytest fixture to simulate user input.
+
+    Returns:
+        None
+    """
+    inputs = iter(['Pet time', 'Walk ducks', '', '', '1', 'done', '', ''])
+    monkeypatch.setattr('builtins.input', lambda _: next(inputs))
+
+    add_task()
+    changed, deleted, token = read_changes()
+    update_task()
+    changed, deleted, token = read_changes(token)
+    assert [(task[0], task[3]) for task in changed] == [(1, 'Done')]
+
+
+def test_get_changes_delete(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that a deleted task is reported as a tombstone.
+
+    Args:
+        monkeypatch: Pytest fixture to simulate user input.
+
+    Returns:
+        None
+    """
+    inputs = iter(['Pet time', 'Walk ducks', '', '', '1'])
+    monkeypatch.setattr('builtins.input', lambda _: next(inputs))
+
+    add_task()
+    changed, deleted, token = read_changes()
+    delete_task()
+    changed, deleted, token = read_changes(token)
+    assert changed == []
+    assert deleted == [1]
+
+
+def test_get_changes_late_commit(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that a change younger than CHANGE_WINDOW is held back
+    and reported once it is old enough, even when newer changes
+    were reported meanwhile.
+
+    Args:
+        monkeypatch: Pytest fixture for patching.
+
+    Returns:
+        None
+    """
+    monkeypatch.setattr(main, 'CHANGE_WINDOW', timedelta(hours=1))
+    insert_aged('Old', '2 HOUR')
+    changed, deleted, token = read_changes()
+    assert [task[1] for task in changed] == ['Old']
+
+    insert_aged('Late', '30 MINUTE')
+    assert read_changes(token) == ([], [], token)
+
+    monkeypatch.setattr(main, 'CHANGE_WINDOW', timedelta(minutes=10))
+    changed, deleted, token = read_changes(token)
+    assert [task[1] for task in changed] == ['Late']
+    assert read_changes(token) == ([], [], token)
+
+
+def test_get_changes_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that a limited read returns the changes in batches
+    with a compact string token.
+
+    Args:
+        monkeypatch: Pytest fixture to simulate user input.
+
+    Returns:
+        None
+    """
+    inputs = iter(['Pet time', 'Walk ducks', '', '', 'Feed', 'Feed ducks',
+                   '', '', 'Swim', 'Swim with ducks', '', ''])
+    monkeypatch.setattr('builtins.input', lambda _: next(inputs))
+    for _ in range(3):
+        add_task()
+
+    names = []
+    token = None
+    for _ in range(3):
+        changed, deleted, token = read_changes(token, limit=1)
+        names += [task[1] for task in changed]
+        assert isinstance(token, str) and len(token) < 80
+    assert names == ['Pet time', 'Feed', 'Swim']
+    assert read_changes(token, limit=1) == ([], [], token)
+
+
+@pytest.mark.parametrize('token', ['', 'x;y', '2024-01-01/1', ';;'])
+def test_get_changes_invalid_token(token: str) -> None:
+    """
+    Tests that malformed tokens are rejected.
+
+    Args:
+        token (str): Malformed token.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ValueError):
+        read_changes(token)
@@ -6,6 +6,7 @@ and output messages.
 
 import pytest
 
+import src.main as main
 from src.main import get_db_cursor, add_task, delete_task
 
 
@@ -24,7 +25,7 @@ def test_delete_task_positive(
     Returns:
         None
     """
-    inputs = iter(['Pet time', 'Walk ducks', id_])
+    inputs = iter(['Pet time', 'Walk ducks', '', '', id_])
     monkeypatch.setattr('builtins.input', lambda _: next(inputs))
 
     add_task()
@@ -68,9 +69,9 @@ def test_delete_task_output(
         None
     """
     if expected == 'ID not found.':
-        inputs = iter(['Pet time', 'Walk ducks', id_, '1'])
+        inputs = iter(['Pet time', 'Walk ducks', '', '', id_, '1'])
     else:
-        inputs = iter(['Pet time', 'Walk ducks', id_])
+        inputs = iter(['Pet time', 'Walk ducks', '', '', id_])
     monkeypatch.setattr('builtins.input', lambda _: next(inputs))
     printed = []
     monkeypatch.setattr('builtins.print', printed.append)
@@ -97,3 +98,32 @@ def test_delete_task_empty(monkeypatch: pytest.MonkeyPatch) -> None:
     delete_task()
     expected = 'The list is empty.'
     assert any(expected in line for line in printed)
+
+
+def test_delete_task_vanished(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that a task missing on the primary, for example deleted
+    after the ID was checked, is reported as not found
+    and gets no tombstone.
+
+    Args:
+        monkeypatch:
+            Pytest fixture to simulate user input and capture print.
+
+    Returns:
+        None
+    """
+    inputs = iter(['Pet time', 'Walk ducks', '', '', '2'])
+    monkeypatch.setattr('builtins.input', lambda _: next(inputs))
+    monkeypatch.setattr(main, 'task_exists', lambda cursor, task_id: True)
+    printed = []
+    monkeypatch.setattr('builtins.print', printed.append)
+
+    add_task()
+    delete_task()
+    assert 'ID not found.' in printed
+    assert not any('successfully deleted' in line for line in printed)
+    with get_db_cursor() as cursor_data:
+        conn, cursor = cursor_data
+        cursor.execute("SELECT ID FROM task_tombstones")
+        assert cursor.fetchall() == []
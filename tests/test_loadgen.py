@@ -0,0 +1,144 @@
+"""
+Unit tests for the load generator of the Task Manager application.
+These tests verify mix parsing, percentile calculation and a short
+threaded run against the embedded SQLite backend that cleans up
+after itself.
+"""
+
+import pytest
+
+import src.loadgen as loadgen
+from src.loadgen import (
+    OPERATIONS, parse_mix, percentile, setup_store, run_load, cleanup_store,
+    get_sqlite_cursor
+)
+
+
+@pytest.mark.parametrize(
+    'text, expected',
+    [
+        ('add=1', {'add': 1}),
+        ('add=20, list=10,delete=0',
+         {'add': 20, 'list': 10, 'delete': 0}),
+    ]
+)
+def test_parse_mix_positive(text: str, expected: dict) -> None:
+    """
+    Tests that valid operation mixes are parsed.
+
+    Args:
+        text (str): Mix given on the command line.
+        expected (dict): Expected operation weights.
+
+    Returns:
+        None
+    """
+    assert parse_mix(text) == expected
+
+
+@pytest.mark.parametrize('text', ['drop=1', 'add=0', 'add=x', ''])
+def test_parse_mix_negative(text: str) -> None:
+    """
+    Tests that invalid operation mixes are rejected.
+
+    Args:
+        text (str): Mix given on the command line.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ValueError):
+        parse_mix(text)
+
+
+@pytest.mark.parametrize(
+    'values, pct, expected',
+    [
+        ([], 50, 0.0),
+        ([3.0], 99, 3.0),
+        ([float(n) for n in range(1, 101)], 50, 50.0),
+        ([float(n) for n in range(1, 101)], 95, 95.0),
+        ([float(n) for n in range(100, 0, -1)], 99, 99.0),
+    ]
+)
+def test_percentile(values: list[float], pct: float, expected: float) -> None:
+    """
+    Tests nearest-rank percentiles.
+
+    Args:
+        values (list[float]): Measured values.
+        pct (float): Requested percentile.
+        expected (float): Expected percentile value.
+
+    Returns:
+        None
+    """
+    assert percentile(values, pct) == expected
+
+
+def test_run_load_sqlite(tmp_path) -> None:
+    """
+    Tests a short threaded run against the SQLite backend
+    and that only the tasks of the run are removed afterwards.
+
+    Args:
+        tmp_path: Pytest fixture with a temporary directory.
+
+    Returns:
+        None
+    """
+    settings = {
+        'backend': 'sqlite',
+        'path': str(tmp_path / 'tasks.db'),
+        'mode': 'thread',
+        'workers': 4,
+        'duration': 0.5,
+        'interval': 0.25,
+        'mix': parse_mix('add=1,list=1,filter=1,update=1,delete=1'),
+        'seed_rows': 20,
+        'seed': 0,
+        'warmup': 0.0,
+        'tag': 'Load test run',
+    }
+    setup_store(settings)
+    with get_sqlite_cursor(settings['path']) as (conn, cursor):
+        cursor.execute(
+            "INSERT INTO tasks (Name, Description) VALUES ('Keep', 'Mine')"
+        )
+        conn.commit()
+    samples = run_load(settings)
+
+    assert samples
+    assert {sample[1] for sample in samples} <= set(OPERATIONS)
+    assert all(sample[3] for sample in samples)
+
+    assert cleanup_store(settings) >= 20
+    with get_sqlite_cursor(settings['path']) as (conn, cursor):
+        cursor.execute("SELECT Name FROM tasks")
+        assert cursor.fetchall() == [('Keep',)]
+
+
+def test_main_skips_cleanup_without_setup(
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Tests that a failed setup is reported as is,
+    without a cleanup attempt hiding the error.
+
+    Args:
+        monkeypatch: Pytest fixture for patching.
+
+    Returns:
+        None
+    """
+    def fail_setup(settings: dict) -> None:
+        raise ConnectionError('Failed to connect to the database.')
+
+    cleanups = []
+    monkeypatch.setattr(loadgen, 'setup_store', fail_setup)
+    monkeypatch.setattr(loadgen, 'cleanup_store', cleanups.append)
+    monkeypatch.setattr('sys.argv', ['loadgen', '--backend', 'mysql'])
+
+    with pytest.raises(ConnectionError, match='Failed to connect'):
+        loadgen.main()
+    assert cleanups == []
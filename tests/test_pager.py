@@ -0,0 +1,127 @@
+"""
+Unit tests for paging through tasks in the Task Manager application.
+These tests verify page queries and navigation commands of the pager.
+"""
+
+import pytest
+
+from src.main import (
+    PAGE_SIZE, get_db_cursor, insert_task, set_task_status,
+    fetch_page, TaskPager
+)
+
+
+@pytest.fixture
+def cursor():
+    """
+    Inserts 25 tasks, every third one Done, and yields a cursor.
+
+    Yields:
+        Database cursor with the tasks committed.
+    """
+    with get_db_cursor() as cursor_data:
+        conn, cursor = cursor_data
+        for number in range(1, 26):
+            task_id = insert_task(cursor, f'Task {number}', 'Walk ducks')
+            if number % 3 == 0:
+                set_task_status(cursor, task_id, 'Done')
+        conn.commit()
+        yield cursor
+
+
+def ids(rows: list[tuple]) -> list[int]:
+    """
+    Returns the IDs of the task records.
+
+    Args:
+        rows (list[tuple]): Task records.
+
+    Returns:
+        list[int]: Their IDs.
+    """
+    return [row[0] for row in rows]
+
+
+def test_fetch_page(cursor) -> None:
+    """
+    Tests forward, backward and filtered page queries.
+
+    Args:
+        cursor: Fixture with 25 tasks.
+
+    Returns:
+        None
+    """
+    assert ids(fetch_page(cursor)) == list(range(1, PAGE_SIZE + 1))
+    assert ids(fetch_page(cursor, 21)) == [21, 22, 23, 24, 25]
+    assert ids(fetch_page(cursor, 21, backwards=True)) == list(range(11, 21))
+    assert ids(fetch_page(cursor, 3, backwards=True)) == [1, 2]
+    assert ids(fetch_page(cursor, 10, 'Done', size=3)) == [12, 15, 18]
+    assert fetch_page(cursor, 26) == []
+
+
+@pytest.mark.parametrize(
+    'commands, expected_page, expected_output',
+    [
+        (['n', 'x'], 11, None),
+        (['n', 'n', 'n', 'x'], 21, 'This is the last page.'),
+        (['p', 'x'], 1, 'This is the first page.'),
+        (['n', 'p', 'x'], 1, None),
+        (['j 17', 'x'], 17, None),
+        (['J17', 'x'], 17, None),
+        (['j 99', 'x'], 1, 'No tasks from this ID on.'),
+    ]
+)
+def test_pager_navigation(
+    monkeypatch: pytest.MonkeyPatch,
+    cursor,
+    commands: list[str],
+    expected_page: int,
+    expected_output: str | None
+) -> None:
+    """
+    Tests that navigation commands move between pages
+    and that other input is returned to the caller.
+
+    Args:
+        monkeypatch:
+            Pytest fixture to simulate user input and capture output.
+        cursor: Fixture with 25 tasks.
+        commands (list[str]): Inputs entered at the prompt.
+        expected_page (int): First ID of the final page.
+        expected_output (str | None): Expected printed message.
+
+    Returns:
+        None
+    """
+    inputs = iter(commands)
+    monkeypatch.setattr('builtins.input', lambda _: next(inputs))
+    printed = []
+    monkeypatch.setattr('builtins.print', printed.append)
+
+    pager = TaskPager(cursor)
+    assert pager.show_first()
+    assert pager.ask('Enter ID') == 'x'
+    assert pager.page[0][0] == expected_page
+    assert len(pager.page) <= PAGE_SIZE
+    if expected_output is not None:
+        assert expected_output in printed
+
+
+def test_pager_empty(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests the pager when there are no tasks.
+
+    Args:
+        monkeypatch: Pytest fixture to capture printed output.
+
+    Returns:
+        None
+    """
+    printed = []
+    monkeypatch.setattr('builtins.print', printed.append)
+
+    with get_db_cursor() as cursor_data:
+        conn, cursor = cursor_data
+        assert not TaskPager(cursor).show_first()
+    assert 'The list is empty.' in printed
@@ -0,0 +1,179 @@
+"""
+Unit tests for the task query builder of the Task Manager application.
+These tests verify filtering, sorting and limits, and capture EXPLAIN
+output for every combination of filters and sort orders to make sure
+none of them falls back to a full table or index scan.
+"""
+
+from datetime import datetime, timedelta
+from itertools import product
+
+import pytest
+
+from src.main import (
+    PAGE_SIZE, SORT_COLUMNS, STATUSES, get_db_cursor, build_task_query,
+    find_tasks
+)
+
+START = datetime(2024, 1, 1)
+SEED_ROWS = 3000
+FILTER_SHAPES = {
+    'none': {},
+    'status': {'status': 'Done'},
+    'created_range': {
+        'created_from': START + timedelta(days=10),
+        'created_to': START + timedelta(days=11),
+    },
+    'name_prefix': {'name_prefix': 'Walk 12'},
+    'status_created_range': {
+        'status': 'In Progress',
+        'created_from': START + timedelta(days=10),
+        'created_to': START + timedelta(days=20),
+    },
+    'status_name_prefix': {'status': 'Done', 'name_prefix': 'Walk 1'},
+    'created_range_name_prefix': {
+        'created_from': START + timedelta(days=40),
+        'created_to': START + timedelta(days=50),
+        'name_prefix': 'Walk 1',
+    },
+    'all': {
+        'status': 'Not Started',
+        'created_from': START + timedelta(days=40),
+        'created_to': START + timedelta(days=50),
+        'name_prefix': 'Walk 1',
+    },
+}
+
+
+def seed_tasks(count: int) -> None:
+    """
+    Inserts tasks with cycling statuses, one creation hour apart.
+
+    Args:
+        count (int): Number of tasks to insert.
+
+    Returns:
+        None
+    """
+    with get_db_cursor() as cursor_data:
+        conn, cursor = cursor_data
+        cursor.executemany(
+            "INSERT INTO tasks (Name, Description, Status, Created) "
+            "VALUES (%s, %s, %s, %s)",
+            [
+                (f'Walk {number}', 'Walk ducks', STATUSES[number % 3],
+                 START + timedelta(hours=number))
+                for number in range(count)
+            ]
+        )
+        conn.commit()
+        cursor.execute("ANALYZE TABLE tasks")
+        cursor.fetchall()
+
+
+@pytest.mark.parametrize(
+    'filters, expected_ids',
+    [
+        ({'status': 'Done', 'limit': 3}, [3, 6, 9]),
+        ({'status': 'Done', 'descending': True, 'limit': 2}, [30, 27]),
+        ({'created_from': START + timedelta(hours=5),
+          'created_to': START + timedelta(hours=8)}, [6, 7, 8]),
+        ({'name_prefix': 'Walk 2', 'order_by': 'Name', 'limit': None},
+         [3] + list(range(21, 31))),
+        ({'status': 'In Progress', 'name_prefix': 'Walk 1',
+          'order_by': 'Name'}, [2, 11, 14, 17, 20]),
+        ({'order_by': 'Created', 'descending': True, 'limit': 1}, [30]),
+        ({}, list(range(1, 31))),
+    ]
+)
+def test_find_tasks(filters: dict, expected_ids: list[int]) -> None:
+    """
+    Tests that combined filters, sorting and limits return
+    the expected tasks.
+
+    Args:
+        filters (dict): Keyword arguments for find_tasks.
+        expected_ids (list[int]): Expected task IDs in order.
+
+    Returns:
+        None
+    """
+    seed_tasks(30)
+    with get_db_cursor() as cursor_data:
+        conn, cursor = cursor_data
+        result = find_tasks(cursor, **filters)
+    assert [task[0] for task in result] == expected_ids
+
+
+def test_find_tasks_escapes_prefix() -> None:
+    """
+    Tests that wildcard characters in the name prefix match literally.
+
+    Returns:
+        None
+    """
+    seed_tasks(3)
+    with get_db_cursor() as cursor_data:
+        conn, cursor = cursor_data
+        assert find_tasks(cursor, name_prefix='Walk%') == []
+        assert find_tasks(cursor, name_prefix='Wal_') == []
+
+
+@pytest.mark.parametrize(
+    'filters',
+    [{'order_by': 'Description'}, {'order_by': 'Priority'},
+     {'limit': 0}, {'limit': -1}]
+)
+def test_build_task_query_negative(filters: dict) -> None:
+    """
+    Tests that invalid sort columns and limits are rejected.
+
+    Args:
+        filters (dict): Invalid keyword arguments.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ValueError):
+        build_task_query(**filters)
+
+
+@pytest.mark.parametrize('shape', FILTER_SHAPES)
+def test_filter_shape_uses_index(shape: str) -> None:
+    """
+    Tests that EXPLAIN of a page of the filter shape, in every sort
+    order, shows no full table scan, no full index scan (including
+    the clustered PRIMARY index) beyond the rows the LIMIT needs,
+    and a bounded row estimate.
+
+    Args:
+        shape (str): Name of the filter shape in FILTER_SHAPES.
+
+    Returns:
+        None
+    """
+    seed_tasks(SEED_ROWS)
+    with get_db_cursor() as cursor_data:
+        conn, cursor = cursor_data
+        for order_by, descending in product(SORT_COLUMNS, (False, True)):
+            query, params = build_task_query(
+                **FILTER_SHAPES[shape], order_by=order_by,
+                descending=descending, limit=PAGE_SIZE
+            )
+            cursor.execute(f"EXPLAIN {query}", params)
+            plan = [
+                dict(zip(cursor.column_names, row))
+                for row in cursor.fetchall()
+            ]
+            label = f'{shape} by {order_by}{" desc" if descending else ""}'
+            for row in plan:
+                assert row['type'] != 'ALL', (
+                    f'{label} scans the whole table: {plan}'
+                )
+                if row['type'] == 'index':
+                    assert row['rows'] <= PAGE_SIZE, (
+                        f'{label} scans the whole {row["key"]} index: {plan}'
+                    )
+                assert row['rows'] <= SEED_ROWS // 2, (
+                    f'{label} examines too many rows: {plan}'
+                )
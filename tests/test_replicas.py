@@ -0,0 +1,259 @@
+"""
+Unit tests for read replica routing in the Task Manager application.
+These tests verify round-robin selection, skipping of failed replicas,
+read-your-writes and fallback to the primary database.
+"""
+
+import time
+
+import pytest
+
+import src.main as main
+from src.main import (
+    commit, connect_replica, db_session, get_db_cursor, next_replica,
+    mark_replica_down
+)
+
+
+class FakeReplica:
+    """
+    Stand-in for a replica connection reporting a fixed replication lag.
+    """
+
+    def __init__(self, host: str, lag: int | None):
+        self.host = host
+        self.lag = lag
+        self.checks = 0
+        self.closed = False
+
+    def is_connected(self) -> bool:
+        return True
+
+    def cursor(self, dictionary: bool = False):
+        replica = self
+
+        class Cursor:
+            def execute(self, query: str) -> None:
+                replica.checks += 1
+
+            def fetchall(self) -> list[dict]:
+                return [{'Seconds_Behind_Source': replica.lag}]
+
+            def close(self) -> None:
+                pass
+
+        return Cursor()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def replicas(monkeypatch: pytest.MonkeyPatch) -> list[dict]:
+    """
+    Configures two replicas and a fresh routing state.
+
+    Args:
+        monkeypatch: Pytest fixture for patching.
+
+    Returns:
+        list[dict]: Configured replica connection settings.
+    """
+    configs = [
+        {**main.DB_CONFIG, 'host': 'replica-1'},
+        {**main.DB_CONFIG, 'host': 'replica-2'},
+    ]
+    monkeypatch.setattr(main, 'REPLICA_CONFIGS', configs)
+    monkeypatch.setattr(
+        main, '_replica_state',
+        {'next': 0, 'down_until': {}, 'checked_until': {}}
+    )
+    return configs
+
+
+def test_next_replica_without_replicas(
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Tests that reads go to the primary when no replica is configured.
+
+    Args:
+        monkeypatch: Pytest fixture for patching.
+
+    Returns:
+        None
+    """
+    monkeypatch.setattr(main, 'REPLICA_CONFIGS', [])
+    assert next_replica() is None
+
+
+def test_next_replica_round_robin(replicas: list[dict]) -> None:
+    """
+    Tests that replicas are picked in round-robin order.
+
+    Args:
+        replicas: Fixture configuring two replicas.
+
+    Returns:
+        None
+    """
+    assert [next_replica() for _ in range(4)] == [0, 1, 0, 1]
+
+
+def test_next_replica_skips_down(replicas: list[dict]) -> None:
+    """
+    Tests that a replica marked down is skipped,
+    and that all replicas down falls back to the primary.
+
+    Args:
+        replicas: Fixture configuring two replicas.
+
+    Returns:
+        None
+    """
+    mark_replica_down(0)
+    assert [next_replica() for _ in range(3)] == [1, 1, 1]
+    mark_replica_down(1)
+    assert next_replica() is None
+
+
+def test_next_replica_read_your_writes(replicas: list[dict]) -> None:
+    """
+    Tests that reads of a session right after its commit
+    go to the primary, while other reads keep using the replicas.
+
+    Args:
+        replicas: Fixture configuring two replicas.
+
+    Returns:
+        None
+    """
+    with db_session() as session:
+        with get_db_cursor() as cursor_data:
+            conn, cursor = cursor_data
+            cursor.execute("SELECT COUNT(*) FROM tasks")
+            cursor.fetchall()
+        assert next_replica() == 0
+
+        with get_db_cursor() as cursor_data:
+            conn, cursor = cursor_data
+            commit(conn)
+        assert next_replica() is None
+
+        session.last_write = time.monotonic() - session.read_your_writes - 1
+        assert next_replica() == 1
+
+    with db_session():
+        assert next_replica() == 0
+
+
+def test_commit_outside_session(replicas: list[dict]) -> None:
+    """
+    Tests that commits outside a session do not pin reads to the primary.
+
+    Args:
+        replicas: Fixture configuring two replicas.
+
+    Returns:
+        None
+    """
+    with get_db_cursor() as cursor_data:
+        conn, cursor = cursor_data
+        commit(conn)
+    assert next_replica() == 0
+
+
+def test_read_falls_back_to_primary(
+    monkeypatch: pytest.MonkeyPatch,
+    replicas: list[dict]
+) -> None:
+    """
+    Tests that unreachable replicas are marked down
+    and the read is served by the primary database.
+
+    Args:
+        monkeypatch: Pytest fixture for patching.
+        replicas: Fixture configuring two replicas.
+
+    Returns:
+        None
+    """
+    connect = main.mysql.connector.connect
+
+    def fake_connect(**config):
+        if config['host'].startswith('replica'):
+            raise ConnectionError('replica unreachable')
+        return connect(**config)
+
+    monkeypatch.setattr(main.mysql.connector, 'connect', fake_connect)
+    monkeypatch.setattr('builtins.print', lambda *args: None)
+
+    with get_db_cursor(read_only=True) as cursor_data:
+        conn, cursor = cursor_data
+        cursor.execute("SELECT COUNT(*) FROM tasks")
+        assert cursor.fetchone()[0] == 0
+    assert set(main._replica_state['down_until']) == {0, 1}
+
+
+def test_lagging_replica_is_skipped(
+    monkeypatch: pytest.MonkeyPatch,
+    replicas: list[dict]
+) -> None:
+    """
+    Tests that a replica lagging more than REPLICA_MAX_LAG is marked
+    down, and that a passed health check is reused for a while.
+
+    Args:
+        monkeypatch: Pytest fixture for patching.
+        replicas: Fixture configuring two replicas.
+
+    Returns:
+        None
+    """
+    connections = {
+        'replica-1': FakeReplica('replica-1', main.REPLICA_MAX_LAG + 60),
+        'replica-2': FakeReplica('replica-2', 0),
+    }
+    monkeypatch.setattr(
+        main.mysql.connector, 'connect',
+        lambda **config: connections[config['host']]
+    )
+    monkeypatch.setattr('builtins.print', lambda *args: None)
+
+    assert connect_replica() is connections['replica-2']
+    assert connections['replica-1'].closed
+    assert set(main._replica_state['down_until']) == {0}
+
+    assert connect_replica() is connections['replica-2']
+    assert connections['replica-2'].checks == 1
+
+
+def test_stopped_replica_is_skipped(
+    monkeypatch: pytest.MonkeyPatch,
+    replicas: list[dict]
+) -> None:
+    """
+    Tests that replicas which are not replicating are marked down
+    and the read is served by the primary database.
+
+    Args:
+        monkeypatch: Pytest fixture for patching.
+        replicas: Fixture configuring two replicas.
+
+    Returns:
+        None
+    """
+    connect = main.mysql.connector.connect
+
+    def fake_connect(**config):
+        if config['host'].startswith('replica'):
+            return FakeReplica(config['host'], None)
+        return connect(**config)
+
+    monkeypatch.setattr(main.mysql.connector, 'connect', fake_connect)
+    monkeypatch.setattr('builtins.print', lambda *args: None)
+
+    conn = connect_replica()
+    assert not isinstance(conn, FakeReplica)
+    conn.close()
+    assert set(main._replica_state['down_until']) == {0, 1}
@@ -0,0 +1,171 @@
+"""
+Unit tests for task priorities and due dates in the Task Manager
+application. These tests verify input validation, updating
+the schedule and the indexed "next tasks" query.
+"""
+
+from datetime import date
+
+import pytest
+
+from src.main import (
+    NEXT_TASKS_QUERY, get_db_cursor, add_task, update_task,
+    insert_task, set_task_status, get_next_tasks
+)
+
+
+def read_schedule() -> list[tuple]:
+    """
+    Returns the priority and due date of all tasks.
+
+    Returns:
+        list[tuple]: (Priority, Due) for every task by ID.
+    """
+    with get_db_cursor() as cursor_data:
+        conn, cursor = cursor_data
+        cursor.execute("SELECT Priority, Due FROM tasks ORDER BY ID")
+        return cursor.fetchall()
+
+
+@pytest.mark.parametrize(
+    'priority_inputs, due_inputs, expected',
+    [
+        ([''], [''], (3, None)),
+        (['1'], ['2030-01-31'], (1, date(2030, 1, 31))),
+        (['0', '6', 'high', ' 5 '], ['none'], (5, None)),
+        (['2'], ['31.1.2030', '2030-02-30', '2030-02-28'],
+         (2, date(2030, 2, 28))),
+    ]
+)
+def test_add_task_schedule(
+    monkeypatch: pytest.MonkeyPatch,
+    priority_inputs: list[str],
+    due_inputs: list[str],
+    expected: tuple
+) -> None:
+    """
+    Tests that invalid priorities and due dates are asked again
+    and valid ones are stored.
+
+    Args:
+        monkeypatch: Pytest fixture to simulate user input.
+        priority_inputs (list[str]): Entered priorities.
+        due_inputs (list[str]): Entered due dates.
+        expected (tuple): Stored (Priority, Due).
+
+    Returns:
+        None
+    """
+    inputs = iter(['Pet time', 'Walk ducks'] + priority_inputs + due_inputs)
+    monkeypatch.setattr('builtins.input', lambda _: next(inputs))
+    printed = []
+    monkeypatch.setattr('builtins.print', printed.append)
+
+    add_task()
+    assert read_schedule() == [expected]
+    if len(priority_inputs) > 1:
+        assert 'Priority must be a number between 1 and 5.' in printed
+    if len(due_inputs) > 1:
+        assert 'Due date must be in YYYY-MM-DD format.' in printed
+
+
+@pytest.mark.parametrize(
+    'priority, due, expected',
+    [
+        ('', '', (2, date(2030, 1, 31))),
+        ('4', '', (4, date(2030, 1, 31))),
+        ('', 'none', (2, None)),
+        ('1', '2031-05-01', (1, date(2031, 5, 1))),
+    ]
+)
+def test_update_task_schedule(
+    monkeypatch: pytest.MonkeyPatch,
+    priority: str,
+    due: str,
+    expected: tuple
+) -> None:
+    """
+    Tests changing, keeping and clearing the schedule of a task.
+
+    Args:
+        monkeypatch: Pytest fixture to simulate user input.
+        priority (str): Entered priority.
+        due (str): Entered due date.
+        expected (tuple): Stored (Priority, Due).
+
+    Returns:
+        None
+    """
+    inputs = iter(
+        ['Pet time', 'Walk ducks', '2', '2030-01-31',
+         '1', 'in progress', priority, due]
+    )
+    monkeypatch.setattr('builtins.input', lambda _: next(inputs))
+
+    add_task()
+    update_task()
+    assert read_schedule() == [expected]
+
+
+def test_get_next_tasks() -> None:
+    """
+    Tests that open tasks come by priority, then due date
+    with undated tasks last, and that Done tasks are skipped.
+
+    Returns:
+        None
+    """
+    with get_db_cursor() as cursor_data:
+        conn, cursor = cursor_data
+        insert_task(cursor, 'Low', 'd', 5, date(2020, 1, 1))
+        insert_task(cursor, 'Undated', 'd', 1)
+        insert_task(cursor, 'Later', 'd', 1, date(2030, 6, 1))
+        insert_task(cursor, 'Sooner', 'd', 1, date(2030, 1, 1))
+        done_id = insert_task(cursor, 'Done', 'd', 1, date(2029, 1, 1))
+        set_task_status(cursor, done_id, 'Done')
+        insert_task(cursor, 'Middle', 'd', 3)
+        conn.commit()
+
+        assert [task[1] for task in get_next_tasks(cursor)] == [
+            'Sooner', 'Later', 'Undated', 'Middle', 'Low'
+        ]
+        assert [task[1] for task in get_next_tasks(cursor, 2)] == [
+            'Sooner', 'Later'
+        ]
+
+
+def test_next_tasks_uses_covering_index() -> None:
+    """
+    Tests that EXPLAIN of the next tasks query reads the open range
+    of the covering index in order without sorting and looks up rows
+    by primary key.
+
+    Returns:
+        None
+    """
+    with get_db_cursor() as cursor_data:
+        conn, cursor = cursor_data
+        cursor.executemany(
+            "INSERT INTO tasks (Name, Description, Priority, Status) "
+            "VALUES (%s, %s, %s, %s)",
+            [
+                (f'Task {number}', 'd', number % 5 + 1,
+                 ('Not Started', 'In Progress', 'Done')[number % 3])
+                for number in range(3000)
+            ]
+        )
+        conn.commit()
+        cursor.execute("ANALYZE TABLE tasks")
+        cursor.fetchall()
+
+        cursor.execute(f"EXPLAIN {NEXT_TASKS_QUERY}", (10,))
+        plan = [
+            dict(zip(cursor.column_names, row)) for row in cursor.fetchall()
+        ]
+    inner = [row for row in plan if row['key'] == 'idx_tasks_open']
+    outer = [row for row in plan if row['table'] == 'tasks'
+             and row['key'] == 'PRIMARY']
+    assert inner and inner[0]['type'] == 'ref', plan
+    assert 'Using index' in (inner[0]['Extra'] or ''), plan
+    assert 'filesort' not in (inner[0]['Extra'] or ''), plan
+    assert outer and outer[0]['type'] == 'eq_ref', plan
@@ -0,0 +1,95 @@
+"""
+Unit tests for schema migrations in the Task Manager application.
+These tests verify that tables created by earlier versions are brought
+up to date by create_table() without losing data, and that running
+the migration again changes nothing.
+"""
+
+from src.main import (
+    TASK_TABLE_COLUMNS, TASK_TABLE_INDEXES, get_db_cursor, create_table
+)
+
+
+def read_schema() -> tuple[list[str], set[str]]:
+    """
+    Returns the columns and index names of the 'tasks' table.
+
+    Returns:
+        tuple: (column names in order, set of index names).
+    """
+    with get_db_cursor() as cursor_data:
+        conn, cursor = cursor_data
+        cursor.execute(
+            "SELECT COLUMN_NAME FROM information_schema.COLUMNS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'tasks' "
+            "ORDER BY ORDINAL_POSITION"
+        )
+        columns = [row[0] for row in cursor.fetchall()]
+        cursor.execute(
+            "SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'tasks'"
+        )
+        indexes = {row[0] for row in cursor.fetchall()}
+    return columns, indexes
+
+
+def test_create_table_migrates_old_schema() -> None:
+    """
+    Tests that the original 'tasks' table gains the new columns
+    and indexes, keeps its rows and drops the obsolete index.
+
+    Returns:
+        None
+    """
+    with get_db_cursor() as cursor_data:
+        conn, cursor = cursor_data
+        cursor.execute("DROP TABLE tasks")
+        cursor.execute("""
+            CREATE TABLE tasks (
+                ID INT AUTO_INCREMENT PRIMARY KEY,
+                Name VARCHAR(50) NOT NULL,
+                Description VARCHAR(500) NOT NULL,
+                Status ENUM(
+                    'Not Started', 'Done', 'In Progress'
+                    ) DEFAULT 'Not Started' NOT NULL,
+                Created DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                Priority TINYINT NOT NULL DEFAULT 3,
+                INDEX idx_tasks_next (Priority)
+            )
+        """)
+        cursor.execute(
+            "INSERT INTO tasks (Name, Description, Status) VALUES "
+            "('Pet time', 'Walk ducks', 'Done'), "
+            "('Feed', 'Feed ducks', 'In Progress')"
+        )
+        conn.commit()
+
+    create_table()
+    columns, indexes = read_schema()
+    assert set(columns) == {name for name, _ in TASK_TABLE_COLUMNS}
+    assert indexes == {name for name, _ in TASK_TABLE_INDEXES} | {'PRIMARY'}
+
+    with get_db_cursor() as cursor_data:
+        conn, cursor = cursor_data
+        cursor.execute(
+            "SELECT Name, Tenant, Priority, Due, DueOrder, IsOpen "
+            "FROM tasks ORDER BY ID"
+        )
+        rows = cursor.fetchall()
+    assert [row[0] for row in rows] == ['Pet time', 'Feed']
+    assert [row[1:4] for row in rows] == [('', 3, None)] * 2
+    assert [row[5] for row in rows] == [0, 1]
+
+
+def test_create_table_is_idempotent() -> None:
+    """
+    Tests that running create_table() on a current schema
+    leaves it unchanged.
+
+    Returns:
+        None
+    """
+    before = read_schema()
+    create_table()
+    create_table()
+    assert read_schema() == before
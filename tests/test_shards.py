@@ -0,0 +1,375 @@
+"""
+Unit tests for sharded multi-tenant storage in the Task Manager
+application. The test database holds the tenant directory and the
+shards are sibling databases with the '_shard0' and '_shard1' suffixes,
+so these tests verify routing, per-tenant isolation, unique IDs,
+fan-out summaries and moving tenants between shards.
+"""
+
+import pytest
+
+import src.shards as shards
+from tests.conftest import TEST_DB_CONFIG, connect_test_db
+
+TEST_SHARDS = [
+    {**TEST_DB_CONFIG, 'database': f"{TEST_DB_CONFIG['database']}_shard{n}"}
+    for n in range(2)
+]
+
+
+@pytest.fixture(autouse=True)
+def two_shards(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Configures two shards, empties them
+    and creates the directory and shard tables.
+
+    Args:
+        monkeypatch: Pytest fixture for patching.
+
+    Returns:
+        None
+    """
+    conn = connect_test_db()
+    cursor = conn.cursor()
+    for config in TEST_SHARDS:
+        database = config['database']
+        cursor.execute(f"CREATE DATABASE IF NOT EXISTS {database}")
+        cursor.execute(
+            f"DROP TABLE IF EXISTS {database}.tasks, "
+            f"{database}.task_tombstones"
+        )
+    conn.commit()
+    cursor.close()
+    conn.close()
+
+    monkeypatch.setattr(shards, 'SHARD_CONFIGS', TEST_SHARDS)
+    monkeypatch.setattr(shards, '_shard_cache', {})
+    shards.create_shard_tables()
+
+
+def shard_rows(index: int, query: str, params: tuple = ()) -> list[tuple]:
+    """
+    Runs a query on one shard and returns its rows.
+
+    Args:
+        index (int): Index into SHARD_CONFIGS.
+        query (str): SQL query to run.
+        params (tuple): Query parameters.
+
+    Returns:
+        list[tuple]: Rows returned by the shard.
+    """
+    with shards.get_shard_cursor(index) as cursor_data:
+        conn, cursor = cursor_data
+        cursor.execute(query, params)
+        return cursor.fetchall()
+
+
+def test_shard_for_is_stable() -> None:
+    """
+    Tests that a tenant is assigned its default shard once
+    and keeps it on later lookups.
+
+    Returns:
+        None
+    """
+    shard = shards.shard_for('ducks')
+    assert shard == shards.default_shard('ducks')
+    shards.forget_shard('ducks')
+    assert shards.shard_for('ducks') == shard
+
+
+def test_shard_for_is_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that repeated lookups are served from the cache
+    and that moving the tenant refreshes it.
+
+    Args:
+        monkeypatch: Pytest fixture for patching.
+
+    Returns:
+        None
+    """
+    shard = shards.shard_for('ducks')
+    with monkeypatch.context() as patch:
+        patch.setattr(shards, 'get_db_cursor', None)
+        assert shards.shard_for('ducks') == shard
+
+    shards.move_tenant('ducks', 1 - shard)
+    assert shards.shard_for('ducks') == 1 - shard
+
+
+def test_stale_cache_read() -> None:
+    """
+    Tests that a tenant moved by another process is found
+    although the cache still points to its old shard.
+
+    Returns:
+        None
+    """
+    shards.add_tenant_task('ducks', 'Pet time', 'Walk ducks')
+    source = shards.shard_for('ducks')
+    shards.move_tenant('ducks', 1 - source)
+    shards._shard_cache['ducks'] = (source, float('inf'))
+
+    assert [task[1] for task in shards.get_tenant_tasks('ducks')] == [
+        'Pet time'
+    ]
+    assert shards.shard_for('ducks') == 1 - source
+
+
+def test_tenant_crud_isolation() -> None:
+    """
+    Tests that tenants only see and change their own tasks.
+
+    Returns:
+        None
+    """
+    duck_id = shards.add_tenant_task('ducks', 'Pet time', 'Walk ducks')
+    goose_id = shards.add_tenant_task('geese', 'Feed', 'Feed geese')
+
+    assert [task[1] for task in shards.get_tenant_tasks('ducks')] == [
+        'Pet time'
+    ]
+    assert not shards.update_tenant_task('ducks', goose_id, 'Done')
+    assert shards.update_tenant_task('ducks', duck_id, ' done ')
+    assert shards.get_tenant_tasks('ducks')[0][3] == 'Done'
+    with pytest.raises(ValueError):
+        shards.update_tenant_task('ducks', duck_id, 'Sleeping')
+    assert not shards.delete_tenant_task('geese', duck_id)
+    assert shards.delete_tenant_task('geese', goose_id)
+    assert shards.get_tenant_tasks('geese') == []
+
+
+def test_fan_out_summary() -> None:
+    """
+    Tests the cross-shard status summary and listing.
+
+    Returns:
+        None
+    """
+    first = shards.add_tenant_task('ducks', 'Pet time', 'Walk ducks')
+    shards.add_tenant_task('geese', 'Feed', 'Feed geese')
+    shards.update_tenant_task('ducks', first, 'Done')
+
+    assert shards.status_summary() == {
+        'Not Started': 1, 'In Progress': 0, 'Done': 1
+    }
+    assert [task[-1] for task in shards.list_all_tasks()] == [
+        'ducks', 'geese'
+    ]
+
+
+def test_fan_out_unreachable_shard(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that an unreachable shard fails the fan-out
+    and is named in the error instead of being skipped.
+
+    Args:
+        monkeypatch: Pytest fixture for patching.
+
+    Returns:
+        None
+    """
+    connect_shard = shards.connect_shard
+    monkeypatch.setattr(
+        shards, 'connect_shard',
+        lambda index: None if index == 1 else connect_shard(index)
+    )
+    with pytest.raises(ConnectionError, match='Unreachable shards: 1.'):
+        shards.status_summary()
+
+
+def test_move_tenant() -> None:
+    """
+    Tests that moving a tenant switches its shard, keeps its tasks
+    and their IDs, and leaves only tombstones of them on the source.
+
+    Returns:
+        None
+    """
+    shards.add_tenant_task('ducks', 'Pet time', 'Walk ducks')
+    shards.add_tenant_task('ducks', 'Feed', 'Feed ducks')
+    source = shards.shard_for('ducks')
+    before = shards.get_tenant_tasks('ducks')
+    target = 1 - source
+
+    assert shards.move_tenant('ducks', target) == 2
+    assert shards.shard_for('ducks') == target
+    assert shards.get_tenant_tasks('ducks') == before
+    assert shard_rows(source, "SELECT ID FROM tasks") == []
+    assert shard_rows(
+        source, "SELECT ID FROM task_tombstones ORDER BY ID"
+    ) == [(task[0],) for task in before]
+    assert shard_rows(target, "SELECT ID FROM task_tombstones") == []
+    assert shards.move_tenant('ducks', target) == 0
+
+
+def test_shard_ids_are_unique() -> None:
+    """
+    Tests that tasks get increasing IDs from the shared counter
+    whichever shard their tenant lives on.
+
+    Returns:
+        None
+    """
+    tenants = ['ducks', 'geese', 'swans', 'hens']
+    assert {shards.shard_for(tenant) for tenant in tenants} == {0, 1}
+    ids = [shards.add_tenant_task(tenant, 'a', 'b') for tenant in tenants]
+    assert ids == sorted(set(ids))
+    assert sorted(task[0] for task in shards.list_all_tasks()) == ids
+
+
+def test_shard_ids_follow_existing_rows() -> None:
+    """
+    Tests that creating the shard tables moves the ID counter
+    past IDs already used on a shard.
+
+    Returns:
+        None
+    """
+    with shards.get_shard_cursor(1) as cursor_data:
+        conn, cursor = cursor_data
+        cursor.execute(
+            "INSERT INTO tasks (ID, Name, Description, Tenant) "
+            "VALUES (100, 'a', 'b', 'ducks')"
+        )
+        conn.commit()
+    shards.create_shard_tables()
+
+    assert shards.add_tenant_task('geese', 'Feed', 'Feed geese') > 100
+
+
+def test_primary_is_not_one_of_several_shards(
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Tests that listing the primary database among several shards
+    is rejected, as its IDs would collide with the shared counter.
+
+    Args:
+        monkeypatch: Pytest fixture for patching.
+
+    Returns:
+        None
+    """
+    monkeypatch.setattr(
+        shards, 'SHARD_CONFIGS', [shards.DB_CONFIG, TEST_SHARDS[1]]
+    )
+    with pytest.raises(ValueError):
+        shards.create_shard_tables()
+
+
+def test_move_tenant_replaces_partial_copy() -> None:
+    """
+    Tests that rows left on the target by an interrupted move
+    are replaced instead of duplicated, and that those deleted
+    on the source since then get tombstones on the target.
+
+    Returns:
+        None
+    """
+    task_id = shards.add_tenant_task('ducks', 'Pet time', 'Walk ducks')
+    target = 1 - shards.shard_for('ducks')
+    with shards.get_shard_cursor(target) as cursor_data:
+        conn, cursor = cursor_data
+        cursor.executemany(
+            "INSERT INTO tasks (ID, Name, Description, Tenant) "
+            "VALUES (%s, 'Pet time', 'Walk ducks', 'ducks')",
+            [(task_id,), (task_id + 1000,)]
+        )
+        conn.commit()
+
+    assert shards.move_tenant('ducks', target) == 1
+    assert [task[0] for task in shards.get_tenant_tasks('ducks')] == [
+        task_id
+    ]
+    assert shard_rows(target, "SELECT ID FROM task_tombstones") == [
+        (task_id + 1000,)
+    ]
+
+
+def test_move_tenant_finishes_interrupted_move() -> None:
+    """
+    Tests that a move interrupted after the directory switch
+    is finished by removing the rows left on the old shard.
+
+    Returns:
+        None
+    """
+    shards.add_tenant_task('ducks', 'Pet time', 'Walk ducks')
+    shard = shards.shard_for('ducks')
+    with shards.get_shard_cursor(1 - shard) as cursor_data:
+        conn, cursor = cursor_data
+        cursor.execute(
+            "INSERT INTO tasks (Name, Description, Tenant) "
+            "VALUES ('Pet time', 'Walk ducks', 'ducks')"
+        )
+        conn.commit()
+    with shards.get_db_cursor() as cursor_data:
+        conn, cursor = cursor_data
+        cursor.execute(
+            "UPDATE tenant_shards SET MovingFrom = %s WHERE Tenant = 'ducks'",
+            (1 - shard,)
+        )
+        conn.commit()
+
+    assert shards.move_tenant('ducks', shard) == 0
+    assert shard_rows(1 - shard, "SELECT ID FROM tasks") == []
+    with shards.get_db_cursor() as cursor_data:
+        conn, cursor = cursor_data
+        cursor.execute("SELECT MovingFrom FROM tenant_shards")
+        assert cursor.fetchall() == [(None,)]
+
+
+def test_move_tenant_stopped_after_copy(
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Tests that a move stopped after copying the tasks leaves listings
+    and summaries without duplicates, holds back writes for the tenant
+    and is finished by running it again.
+
+    Args:
+        monkeypatch: Pytest fixture for patching.
+
+    Returns:
+        None
+    """
+    shards.add_tenant_task('ducks', 'Pet time', 'Walk ducks')
+    shards.add_tenant_task('geese', 'Feed', 'Feed geese')
+    source = shards.shard_for('ducks')
+    target = 1 - source
+    before = shards.list_all_tasks()
+    copy_tenant = shards.copy_tenant
+
+    def copy_and_stop(*args) -> None:
+        copy_tenant(*args)
+        raise ConnectionError('Stopped after the copy.')
+
+    with monkeypatch.context() as patch:
+        patch.setattr(shards, 'copy_tenant', copy_and_stop)
+        with pytest.raises(ConnectionError):
+            shards.move_tenant('ducks', target)
+
+    ducks = "SELECT ID FROM tasks WHERE Tenant = 'ducks'"
+    assert len(shard_rows(target, ducks)) == 1
+    assert shards.list_all_tasks() == before
+    assert shards.status_summary()['Not Started'] == 2
+    monkeypatch.setattr(shards, 'MOVE_WAIT', 0)
+    assert shards.add_tenant_task('ducks', 'Swim', 'Swim ducks') is None
+
+    assert shards.move_tenant('ducks', target) == 1
+    assert shards.list_all_tasks() == before
+    assert shard_rows(source, ducks) == []
+
+
+def test_move_tenant_unknown_shard() -> None:
+    """
+    Tests that moving a tenant to a missing shard is rejected.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ValueError):
+        shards.move_tenant('ducks', 5)
@@ -4,8 +4,11 @@ These tests verify updating task status, handling invalid input,
 and output messages.
 """
 
+from datetime import date
+
 import pytest
 
+import src.main as main
 from src.main import get_db_cursor, add_task, update_task
 
 
@@ -38,7 +41,7 @@ def test_update_task_positive(
     Returns:
         None
     """
-    inputs = iter(['Pet time', 'Walk ducks', id_, status])
+    inputs = iter(['Pet time', 'Walk ducks', '', '', id_, status, '', ''])
     monkeypatch.setattr('builtins.input', lambda _: next(inputs))
 
     add_task()
@@ -79,7 +82,10 @@ def test_update_task_multiple(
     Returns:
         None
     """
-    inputs = iter(['Pet time', 'Walk ducks', id_1, status_1, id_2, status_2])
+    inputs = iter(
+        ['Pet time', 'Walk ducks', '', '',
+         id_1, status_1, '', '', id_2, status_2, '', '']
+    )
     monkeypatch.setattr('builtins.input', lambda _: next(inputs))
 
     add_task()
@@ -100,7 +106,7 @@ def test_update_task_multiple(
         ('one', '', 'ID not found.'),
         ('', '', 'ID not found.'),
         ('DROP TABLE IF EXISTS tasks', '', 'ID not found.'),
-        ('1', ' ', 'Invalid choice. Enter "In Progress" or "Done".'),
+        ('1', ' ', 'Task ID 1 was successfully updated.'),
         ('1', 'Not Started',
          'Invalid choice. Enter "In Progress" or "Done".'),
         ('1', 'DROP TABLE IF EXISTS tasks',
@@ -129,7 +135,7 @@ def test_update_task_output(
     Returns:
         None
     """
-    inputs = iter(['Pet time', 'Walk ducks', id_, status])
+    inputs = iter(['Pet time', 'Walk ducks', '', '', id_, status, '', ''])
     monkeypatch.setattr('builtins.input', lambda _: next(inputs))
     printed = []
     monkeypatch.setattr('builtins.print', printed.append)
@@ -157,3 +163,52 @@ def test_update_task_empty(monkeypatch: pytest.MonkeyPatch) -> None:
     update_task()
     expected = 'The list is empty.'
     assert any(expected in line for line in printed)
+
+
+def test_update_task_keeps_status(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that a Not Started task can be rescheduled
+    while an empty status answer keeps its status.
+
+    Args:
+        monkeypatch: Pytest fixture to simulate user input.
+
+    Returns:
+        None
+    """
+    inputs = iter(
+        ['Pet time', 'Walk ducks', '', '', '1', '', '1', '2030-01-31']
+    )
+    monkeypatch.setattr('builtins.input', lambda _: next(inputs))
+
+    add_task()
+    update_task()
+    with get_db_cursor() as cursor_data:
+        conn, cursor = cursor_data
+        cursor.execute("SELECT Status, Priority, Due FROM tasks")
+        result = cursor.fetchone()
+    assert result == ('Not Started', 1, date(2030, 1, 31))
+
+
+def test_update_task_vanished(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Tests that a task missing on the primary, for example deleted
+    after the ID was checked, is reported as not found.
+
+    Args:
+        monkeypatch:
+            Pytest fixture to simulate user input and capture print.
+
+    Returns:
+        None
+    """
+    inputs = iter(['Pet time', 'Walk ducks', '', '', '1', 'done', '', ''])
+    monkeypatch.setattr('builtins.input', lambda _: next(inputs))
+    monkeypatch.setattr(main, 'lock_task', lambda cursor, task_id: False)
+    printed = []
+    monkeypatch.setattr('builtins.print', printed.append)
+
+    add_task()
+    update_task()
+    assert 'ID not found.' in printed
+    assert not any('successfully updated' in line for line in printed)